@@ -1,8 +1,15 @@
 import json
 import docx
-from openai import OpenAI
 import re
 
+# Import OpenAI (the reason is kept so it can be reported when AI is actually used)
+try:
+    from openai import OpenAI
+    _OPENAI_IMPORT_ERROR = None
+except ImportError as e:
+    OpenAI = None
+    _OPENAI_IMPORT_ERROR = str(e)
+
 # Import enhanced extraction for images
 try:
     from extract_word_content import extract_images_from_docx
@@ -31,6 +38,9 @@ class AIDocumentAnalyzer:
     
     def setup_openai(self):
         """Setup OpenAI client if API key is available."""
+        if OpenAI is None:
+            print(f"⚠️  OpenAI package not available ({_OPENAI_IMPORT_ERROR}). Install it with: pip install openai")
+            return
         api_key = OPENAI_CONFIG.get("api_key")
         if api_key and api_key != "YOUR_OPENAI_API_KEY_HERE":
             try:
@@ -226,13 +236,20 @@ Please extract all actionable tasks and format them as JSON:
         
         return formatted_description
 
-# Global instance for easy access
-ai_analyzer = AIDocumentAnalyzer()
+# Global instance for easy access, created on first use so importing this module has no side effects
+ai_analyzer = None
+
+def get_ai_analyzer():
+    """Return the shared AIDocumentAnalyzer, creating it on first call."""
+    global ai_analyzer
+    if ai_analyzer is None:
+        ai_analyzer = AIDocumentAnalyzer()
+    return ai_analyzer
 
 def get_ai_enhanced_issues(filename):
     """Convenience function to get AI-enhanced issues."""
-    return ai_analyzer.get_ai_enhanced_issues(filename)
+    return get_ai_analyzer().get_ai_enhanced_issues(filename)
 
 def is_ai_available():
     """Check if AI analysis is available."""
-    return ai_analyzer.is_available() 
\ No newline at end of file
+    return get_ai_analyzer().is_available() 
\ No newline at end of file
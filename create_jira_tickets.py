@@ -1,14 +1,24 @@
 import docx
 import sys
-from jira import JIRA, JIRAError
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+
+# The jira package (and requests under it) is only imported by the functions that talk to Jira,
+# so parse-only users such as the GUI preview don't pay for it.
 
 # Import enhanced extraction functions
 try:
-    from extract_word_content import get_enhanced_text_with_images, parse_enhanced_issues
+    from extract_word_content import get_enhanced_text_with_images, iter_enhanced_issues as iter_enhanced_blocks
     ENHANCED_EXTRACTION_AVAILABLE = True
 except ImportError:
     ENHANCED_EXTRACTION_AVAILABLE = False
 
+# Tickets are read from the issue iterable and created this many at a time
+CREATE_BATCH_SIZE = 50
+
+# Projects looked up by get_project, by (server URL, project key); see clear_project_cache
+_project_cache = {}
+
 def get_text(filename):
     """
     Extracts all text from a .docx file.
@@ -39,11 +49,24 @@ def parse_issues(text):
         list: A list of dictionaries, where each dictionary represents an issue
               (e.g., {'title': '...', 'description': '...'}).
     """
-    issues = []
+    return list(iter_issues(text))
+
+def iter_issues(text):
+    """
+    Yields structured issues from a block of text one by one (see parse_issues).
+    
+    Args:
+        text (str): The text content from the Word document.
+        
+    Yields:
+        dict: An issue (e.g., {'title': '...', 'description': '...'}).
+    """
     # Split by two or more newlines to handle variance in document formatting
-    blocks = [b.strip() for b in text.split('\\n\\n') if b.strip()]
+    blocks = (b.strip() for b in text.split('\\n\\n'))
     
     for block in blocks:
+        if not block:
+            continue
         lines = [line.strip() for line in block.split('\\n') if line.strip()]
         if not lines:
             continue
@@ -54,32 +77,356 @@ def parse_issues(text):
         if not description and len(lines) > 1:
             description = lines[-1]
 
-        issues.append({"title": title, "description": description})
-            
-    return issues
+        yield {"title": title, "description": description}
 
 def get_enhanced_issues(filename):
     """
     Get issues using enhanced extraction (with images) if available, 
     otherwise fall back to basic text extraction.
     """
+    return list(iter_enhanced_issues(filename))
+
+def iter_enhanced_issues(filename):
+    """
+    Yields issues one by one using enhanced extraction (with images) if available,
+    otherwise falls back to basic text extraction.
+    """
     if ENHANCED_EXTRACTION_AVAILABLE:
         try:
             print("🔍 Using enhanced extraction (with images)...")
             content_blocks, extracted_images = get_enhanced_text_with_images(filename)
-            issues = parse_enhanced_issues(content_blocks, extracted_images)
             print(f"📸 Found {len(extracted_images)} images in document")
-            return issues
         except Exception as e:
             print(f"⚠️  Enhanced extraction failed: {e}")
             print("🔄 Falling back to basic text extraction...")
+        else:
+            yield from iter_enhanced_blocks(content_blocks, extracted_images)
+            return
     
     # Fallback to basic extraction
     print("📄 Using basic text extraction...")
     text = get_text(filename)
-    return parse_issues(text)
+    yield from iter_issues(text)
+
+def get_project(jira, project_key):
+    """
+    Returns a Jira project, reusing an earlier lookup of the same key on the same server.
+    
+    Call clear_project_cache() whenever the client is replaced (e.g. new credentials) or
+    projects should be fetched from Jira again.
+    
+    Args:
+        jira (JIRA): An authenticated Jira client.
+        project_key (str): The key of the project.
+        
+    Returns:
+        Project: The project (a JIRAError is raised, and not cached, for an unknown project).
+    """
+    key = (jira.server_url, project_key)
+    project = _project_cache.get(key)
+    if project is None:
+        project = _project_cache[key] = jira.project(project_key)
+    return project
+
+def clear_project_cache():
+    """Forgets every project remembered by get_project."""
+    _project_cache.clear()
+
+def build_issue_fields(project_key, issue, issue_type="Task", epic_key=None):
+    """
+    Builds the Jira fields for a parsed issue.
+    
+    Args:
+        project_key (str): The key of the target Jira project.
+        issue (dict): The parsed issue to create.
+        issue_type (str): The type of issue to create (Task, Story, Bug, Epic).
+        epic_key (str, optional): The key of the epic to assign the ticket to.
+        
+    Returns:
+        tuple: (the fields dict, the epic key the ticket is linked to or None)
+    """
+    issue_dict = {
+        'project': {'key': project_key},
+        'summary': issue['title'],
+        'description': issue['description'],
+        'issuetype': {'name': issue_type},
+    }
+
+    # Add epic link if specified and issue type is not Epic
+    if epic_key and issue_type.lower() != 'epic':
+        # Different Jira instances use different field names for epic links;
+        # 'parent' is the one newer Jira instances use
+        issue_dict['parent'] = {'key': epic_key}
+        return issue_dict, epic_key
+    return issue_dict, None
+
+def create_single_ticket(jira, server, project_key, issue, issue_type="Task", epic_key=None, status_name=None, number=1, total=1, log=print):
+    """
+    Creates one Jira ticket from a parsed issue, attaching its images and setting its status.
+    
+    Args:
+        jira (JIRA): An authenticated Jira client.
+        server (str): The cleaned URL of the Jira instance (used for the ticket URL).
+        project_key (str): The key of the target Jira project.
+        issue (dict): The parsed issue to create.
+        issue_type (str): The type of issue to create (Task, Story, Bug, Epic).
+        epic_key (str, optional): The key of the epic to assign the ticket to.
+        status_name (str, optional): The name of the status to set for the ticket.
+        number (int): The position of this ticket in the batch, for progress messages.
+        total (int): The number of tickets in the batch, for progress messages.
+        log (callable): Receives each progress message (defaults to print).
+        
+    Returns:
+        dict: Details of the created ticket (key, title, type, epic, status, images, url).
+        
+    Raises:
+        Exception: If the ticket itself could not be created.
+    """
+    issue_dict, linked_epic = build_issue_fields(project_key, issue, issue_type, epic_key)
+    if linked_epic:
+        log(f"🔗 Linking to epic: {linked_epic}")
+
+    log(f"\n🔨 Creating ticket {number}/{total}: {issue['title'][:50]}...")
+    new_issue = jira.create_issue(fields=issue_dict)
+    return finish_ticket(jira, server, issue, new_issue, issue_type, linked_epic, status_name, log)
+
+def finish_ticket(jira, server, issue, new_issue, issue_type="Task", epic_key=None, status_name=None, log=print):
+    """
+    Attaches a newly created ticket's images and sets its status.
+    
+    Args:
+        jira (JIRA): An authenticated Jira client.
+        server (str): The cleaned URL of the Jira instance (used for the ticket URL).
+        issue (dict): The parsed issue the ticket was created from.
+        new_issue (Issue): The ticket Jira created.
+        issue_type (str): The type the ticket was created with.
+        epic_key (str, optional): The epic the ticket was linked to.
+        status_name (str, optional): The name of the status to set for the ticket.
+        log (callable): Receives each progress message (defaults to print).
+        
+    Returns:
+        dict: Details of the created ticket (key, title, type, epic, status, images, url).
+    """
+    # Initialize ticket details
+    ticket_info = {
+        'key': new_issue.key,
+        'title': issue['title'],
+        'type': issue_type,
+        'epic': epic_key,
+        'status': None,
+        'images': 0,
+        'url': f"{server}/browse/{new_issue.key}"
+    }
+
+    log(f"✅ Issue created: {new_issue.key}")
+
+    # Attach images if available
+    if 'images' in issue and issue['images']:
+        log(f"📸 Attaching {len(issue['images'])} images to {new_issue.key}...")
+        images_attached = 0
+        for img in issue['images']:
+            try:
+                # Attach image to the ticket
+                with open(img['path'], 'rb') as img_file:
+                    attachment = jira.add_attachment(
+                        issue=new_issue,
+                        attachment=img_file,
+                        filename=img['filename']
+                    )
+                    log(f"   ✅ Attached: {img['filename']}")
+                    images_attached += 1
+            except Exception as img_error:
+                log(f"   ❌ Failed to attach {img['filename']}: {img_error}")
+
+        ticket_info['images'] = images_attached
+
+    # Try to set the status if specified
+    final_status = "Default"
+    if status_name:
+        try:
+            # Get available transitions for this issue
+            transitions = jira.transitions(new_issue)
+            log(f"🔄 Available transitions: {[t['name'] for t in transitions]}")
+
+            # Look for the specified status
+            target_transition = None
+            for transition in transitions:
+                if transition['name'].lower() == status_name.lower():
+                    target_transition = transition['id']
+                    log(f"🎯 Found target status transition: {transition['name']}")
+                    break
+
+            if target_transition:
+                jira.transition_issue(new_issue, target_transition)
+                log(f"✅ Issue {new_issue.key} moved to '{status_name}' status")
+                final_status = status_name
+            else:
+                log(f"⚠️  Status '{status_name}' not available for {new_issue.key}")
+                final_status = "Default (To Do)"
+
+        except Exception as status_error:
+            log(f"⚠️  Issue {new_issue.key} created but couldn't set status: {status_error}")
+            final_status = "Default (To Do)"
+
+    # Try to set the status to "To Do" explicitly (fallback)
+    elif not status_name:
+        try:
+            # Get available transitions for this issue
+            transitions = jira.transitions(new_issue)
+            log(f"🔄 Available transitions: {[t['name'] for t in transitions]}")
+
+            # Look for "To Do" status or similar
+            todo_transition = None
+            for transition in transitions:
+                transition_name = transition['name'].lower()
+                if any(keyword in transition_name for keyword in ['to do', 'todo', 'open', 'new']):
+                    todo_transition = transition['id']
+                    log(f"🎯 Found 'To Do' transition: {transition['name']}")
+                    break
+
+            if todo_transition:
+                jira.transition_issue(new_issue, todo_transition)
+                log(f"✅ Issue {new_issue.key} moved to 'To Do' status")
+                final_status = "To Do"
+            else:
+                log(f"ℹ️  Issue {new_issue.key} remains in default status")
+                final_status = "Default"
 
-def create_jira_tickets_with_type(server, username, api_token, project_key, issues, issue_type="Task", epic_key=None, status_name=None):
+        except Exception as transition_error:
+            # If we can't set the status, at least the ticket was created
+            log(f"⚠️  Issue {new_issue.key} created but couldn't change status: {transition_error}")
+            final_status = "Default"
+
+    ticket_info['status'] = final_status
+    return ticket_info
+
+def create_jira_tickets_batch(executor, jira, server, project_key, batch, issue_type="Task", epic_key=None, status_name=None, first_number=1, total=None, cancel_event=None):
+    """
+    Creates a batch of tickets with one bulk request, then attaches images and sets statuses concurrently.
+    
+    Args:
+        executor (Executor): The pool the image and status follow-up runs on.
+        jira (JIRA): An authenticated Jira client.
+        server (str): The cleaned URL of the Jira instance.
+        project_key (str): The key of the target Jira project.
+        batch (list): The issue dictionaries to create (at most CREATE_BATCH_SIZE).
+        issue_type (str): The type of issue to create (Task, Story, Bug, Epic).
+        epic_key (str, optional): The key of the epic to assign tickets to.
+        status_name (str, optional): The name of the status to set for created tickets.
+        first_number (int): The position of the batch's first ticket, for progress messages.
+        total (int, optional): The number of tickets overall, for progress messages.
+        cancel_event (threading.Event, optional): When set, the batch is skipped.
+        
+    Returns:
+        tuple: (list of ticket details or None per issue, in batch order;
+                the JIRAError if Jira rejected the credentials or permissions, else None)
+        
+    Raises:
+        JIRAError: If the bulk request was refused for another reason (e.g. the endpoint is disabled).
+    """
+    from jira import JIRAError
+    
+    if cancel_event is not None and cancel_event.is_set():
+        return [None] * len(batch), None
+    
+    last_number = first_number + len(batch) - 1
+    fields = [build_issue_fields(project_key, issue, issue_type, epic_key) for issue in batch]
+    linked_epic = fields[0][1]
+    if linked_epic:
+        print(f"🔗 Linking to epic: {linked_epic}")
+    
+    print(f"\n🔨 Creating tickets {first_number}-{last_number}/{total if total is not None else '?'}...")
+    try:
+        # prefetch=False skips re-reading every created issue, the bulk reply already has its key
+        responses = jira.create_issues(field_list=[issue_dict for issue_dict, _ in fields], prefetch=False)
+    except JIRAError as bulk_error:
+        if bulk_error.status_code not in (401, 403):
+            # The caller falls back to creating tickets one by one
+            raise
+        print(f"❌ Failed to create tickets {first_number}-{last_number}")
+        print(f"   Error: {bulk_error}")
+        return [None] * len(batch), bulk_error
+    
+    def finish_one(issue, new_issue):
+        # Runs on a worker thread; messages are collected so each ticket's output stays together
+        messages = []
+        try:
+            ticket_info = finish_ticket(jira, server, issue, new_issue, issue_type, linked_epic, status_name,
+                                        log=messages.append)
+        except Exception as finish_error:
+            messages.append(f"⚠️  Issue {new_issue.key} created but could not be completed: {finish_error}")
+            ticket_info = None
+        return ticket_info, messages
+    
+    results = [None] * len(batch)
+    futures = {}
+    for index, (issue, response) in enumerate(zip(batch, responses)):
+        if response['status'] == 'Success':
+            futures[executor.submit(finish_one, issue, response['issue'])] = index
+        else:
+            print(f"❌ Failed to create ticket {first_number + index}: {issue['title'][:50]}...")
+            print(f"   Error: {response['error']}")
+    for future in as_completed(futures):
+        ticket_info, messages = future.result()
+        for message in messages:
+            print(message)
+        results[futures[future]] = ticket_info
+    return results, None
+
+def create_jira_tickets_individually(executor, jira, server, project_key, batch, issue_type="Task", epic_key=None, status_name=None, first_number=1, total=None, cancel_event=None):
+    """
+    Creates a batch of tickets concurrently on the given executor, printing each ticket's messages as it finishes.
+    
+    Args:
+        executor (Executor): The pool the tickets are created on.
+        jira (JIRA): An authenticated Jira client.
+        server (str): The cleaned URL of the Jira instance.
+        project_key (str): The key of the target Jira project.
+        batch (list): The issue dictionaries to create.
+        issue_type (str): The type of issue to create (Task, Story, Bug, Epic).
+        epic_key (str, optional): The key of the epic to assign tickets to.
+        status_name (str, optional): The name of the status to set for created tickets.
+        first_number (int): The position of the batch's first ticket, for progress messages.
+        total (int, optional): The number of tickets overall, for progress messages.
+        cancel_event (threading.Event, optional): When set, tickets not yet started are skipped.
+        
+    Returns:
+        tuple: (list of ticket details or None per issue, in batch order;
+                the JIRAError if Jira rejected the credentials or permissions, else None)
+    """
+    from jira import JIRAError
+    
+    def create_one(number, issue):
+        # Runs on a worker thread; messages are collected so each ticket's output stays together
+        messages = []
+        error = None
+        if cancel_event is not None and cancel_event.is_set():
+            return None, messages, error
+        try:
+            ticket_info = create_single_ticket(jira, server, project_key, issue, issue_type, epic_key, status_name,
+                                               number, total if total is not None else '?', log=messages.append)
+        except Exception as create_error:
+            messages.append(f"❌ Failed to create ticket {number}: {issue['title'][:50]}...")
+            messages.append(f"   Error: {create_error}")
+            ticket_info = None
+            error = create_error
+        return ticket_info, messages, error
+    
+    # Tickets are independent, so create them at once; results are reported as they finish
+    results = [None] * len(batch)
+    auth_error = None
+    futures = {executor.submit(create_one, number, issue): number - first_number
+               for number, issue in enumerate(batch, first_number)}
+    for future in as_completed(futures):
+        ticket_info, messages, error = future.result()
+        for message in messages:
+            print(message)
+        results[futures[future]] = ticket_info
+        if isinstance(error, JIRAError) and error.status_code in (401, 403):
+            auth_error = error
+    return results, auth_error
+
+def create_jira_tickets_with_type(server, username, api_token, project_key, issues, issue_type="Task", epic_key=None, status_name=None, max_workers=1, total=None, cancel_event=None, jira=None):
     """
     Connects to Jira and creates tickets based on a list of parsed issues with specified issue type.
     
@@ -88,11 +435,17 @@ def create_jira_tickets_with_type(server, username, api_token, project_key, issu
         username (str): The user's email for Jira authentication.
         api_token (str): The user's Jira API token.
         project_key (str): The key of the target Jira project.
-        issues (list): A list of issue dictionaries to be created.
+        issues (iterable): The issue dictionaries to be created (a list or any iterable, e.g. a generator).
         issue_type (str): The type of issue to create (Task, Story, Bug, Epic).
         epic_key (str, optional): The key of the epic to assign tickets to.
         status_name (str, optional): The name of the status to set for created tickets.
+        max_workers (int): How many tickets to create concurrently (1 creates them one by one).
+        total (int, optional): The number of issues, for progress messages when issues has no len().
+        cancel_event (threading.Event, optional): When set, creation stops; tickets already in flight still finish.
+        jira (JIRA, optional): An already authenticated client to reuse instead of connecting again.
     """
+    from jira import JIRAError
+    
     try:
         print("🔍 Debugging connection details:")
         print(f"   Server URL: {server}")
@@ -113,18 +466,23 @@ def create_jira_tickets_with_type(server, username, api_token, project_key, issu
         
         # Try to establish a connection to the Jira server with more detailed error handling
         try:
-            jira = JIRA(server=server, basic_auth=(username, api_token))
-            print("✅ JIRA object created successfully")
+            if jira is None:
+                from jira_client import connect
+                
+                jira = connect(server, username, api_token)
+                print("✅ JIRA object created successfully")
+            else:
+                print("✅ Reusing existing Jira connection")
         except Exception as jira_init_error:
             print(f"❌ Failed to create JIRA object: {jira_init_error}")
             if "Expecting value" in str(jira_init_error):
-                print("\\n🔍 This error suggests the server URL is not returning valid JSON.")
+                print("\n🔍 This error suggests the server URL is not returning valid JSON.")
                 print("Common causes:")
                 print(f"• '{server}' is not a valid Jira server")
                 print("• The URL points to a login page instead of the API")
                 print("• Network/firewall blocking the connection")
                 print("• SSL certificate issues")
-                print("\\n💡 Try these URLs instead:")
+                print("\n💡 Try these URLs instead:")
                 if ".atlassian.net" in server:
                     print(f"• {server}")
                     print(f"• {server.replace('www.', '')}")
@@ -143,159 +501,75 @@ def create_jira_tickets_with_type(server, username, api_token, project_key, issu
         except Exception as server_info_error:
             print(f"❌ Failed to get server info: {server_info_error}")
             if "Expecting value" in str(server_info_error):
-                print("\\n🔍 The connection was made but server didn't return valid JSON.")
+                print("\n🔍 The connection was made but server didn't return valid JSON.")
                 print("This might mean:")
                 print(f"• '{server}' redirects to a login page")
                 print("• The API endpoint is different")
                 print("• Authentication is required for server info")
-                print("\\n💡 Let's try to continue anyway...")
+                print("\n💡 Let's try to continue anyway...")
             else:
                 raise server_info_error
         
-        print(f"\\n🎫 Creating {len(issues)} tickets in project '{project_key}'...")
+        if total is None and hasattr(issues, '__len__'):
+            total = len(issues)
+        print(f"\n🎫 Creating {total if total is not None else 'the selected'} tickets in project '{project_key}'...")
         
         # First, let's get available issue types and statuses for better error handling
         print("🔍 Checking project access...")
         try:
-            project = jira.project(project_key)
+            project = get_project(jira, project_key)
             print(f"✅ Project found: {project.name}")
         except Exception as project_error:
             print(f"❌ Cannot access project '{project_key}': {project_error}")
             if "404" in str(project_error) or "does not exist" in str(project_error).lower():
-                print(f"\\n💡 Project '{project_key}' was not found. Common issues:")
+                print(f"\n💡 Project '{project_key}' was not found. Common issues:")
                 print("• Project key is case-sensitive (try uppercase)")
                 print("• You don't have permission to view this project")
                 print("• Project doesn't exist")
                 return []
             else:
-                print("\\n💡 Continuing anyway - project might exist but we can't verify...")
+                print("\n💡 Continuing anyway - project might exist but we can't verify...")
         
         created_tickets = []
         ticket_details = []  # Store detailed information about each ticket
         
-        for i, issue in enumerate(issues, 1):
-            try:
-                issue_dict = {
-                    'project': {'key': project_key},
-                    'summary': issue['title'],
-                    'description': issue['description'],
-                    'issuetype': {'name': issue_type},
-                }
-                
-                # Add epic link if specified and issue type is not Epic
-                epic_linked = False
-                if epic_key and issue_type.lower() != 'epic':
+        # Issues may be a lazy iterable: take them a batch at a time so only one batch is held in memory
+        results = []
+        issues_iter = iter(issues)
+        number = 1
+        use_bulk = True
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            while True:
+                if cancel_event is not None and cancel_event.is_set():
+                    print("\n⛔ Cancelled: remaining tickets were not created.")
+                    break
+                batch = list(islice(issues_iter, CREATE_BATCH_SIZE))
+                if not batch:
+                    break
+                batch_results = None
+                if use_bulk:
                     try:
-                        # Different Jira instances use different field names for epic links
-                        # Try the most common ones
-                        issue_dict['parent'] = {'key': epic_key}  # For newer Jira instances
-                        epic_linked = True
-                        print(f"🔗 Linking to epic: {epic_key}")
-                    except Exception as epic_error:
-                        print(f"⚠️  Could not link to epic {epic_key}: {epic_error}")
-                        # Continue creating the ticket without epic link
-                
-                print(f"\n🔨 Creating ticket {i}/{len(issues)}: {issue['title'][:50]}...")
-                new_issue = jira.create_issue(fields=issue_dict)
-                
-                # Initialize ticket details
-                ticket_info = {
-                    'key': new_issue.key,
-                    'title': issue['title'],
-                    'type': issue_type,
-                    'epic': epic_key if epic_linked else None,
-                    'status': None,
-                    'images': 0,
-                    'url': f"{server}/browse/{new_issue.key}"
-                }
-                
-                print(f"✅ Issue created: {new_issue.key}")
-                
-                # Attach images if available
-                if 'images' in issue and issue['images']:
-                    print(f"📸 Attaching {len(issue['images'])} images to {new_issue.key}...")
-                    images_attached = 0
-                    for img in issue['images']:
-                        try:
-                            # Attach image to the ticket
-                            with open(img['path'], 'rb') as img_file:
-                                attachment = jira.add_attachment(
-                                    issue=new_issue,
-                                    attachment=img_file,
-                                    filename=img['filename']
-                                )
-                                print(f"   ✅ Attached: {img['filename']}")
-                                images_attached += 1
-                        except Exception as img_error:
-                            print(f"   ❌ Failed to attach {img['filename']}: {img_error}")
-                    
-                    ticket_info['images'] = images_attached
-                
-                # Try to set the status if specified
-                final_status = "Default"
-                if status_name:
-                    try:
-                        # Get available transitions for this issue
-                        transitions = jira.transitions(new_issue)
-                        print(f"🔄 Available transitions: {[t['name'] for t in transitions]}")
-                        
-                        # Look for the specified status
-                        target_transition = None
-                        for transition in transitions:
-                            if transition['name'].lower() == status_name.lower():
-                                target_transition = transition['id']
-                                print(f"🎯 Found target status transition: {transition['name']}")
-                                break
-                        
-                        if target_transition:
-                            jira.transition_issue(new_issue, target_transition)
-                            print(f"✅ Issue {new_issue.key} moved to '{status_name}' status")
-                            final_status = status_name
-                        else:
-                            print(f"⚠️  Status '{status_name}' not available for {new_issue.key}")
-                            final_status = "Default (To Do)"
-                            
-                    except Exception as status_error:
-                        print(f"⚠️  Issue {new_issue.key} created but couldn't set status: {status_error}")
-                        final_status = "Default (To Do)"
-                
-                # Try to set the status to "To Do" explicitly (fallback)
-                elif not status_name:
-                    try:
-                        # Get available transitions for this issue
-                        transitions = jira.transitions(new_issue)
-                        print(f"🔄 Available transitions: {[t['name'] for t in transitions]}")
-                        
-                        # Look for "To Do" status or similar
-                        todo_transition = None
-                        for transition in transitions:
-                            transition_name = transition['name'].lower()
-                            if any(keyword in transition_name for keyword in ['to do', 'todo', 'open', 'new']):
-                                todo_transition = transition['id']
-                                print(f"🎯 Found 'To Do' transition: {transition['name']}")
-                                break
-                        
-                        if todo_transition:
-                            jira.transition_issue(new_issue, todo_transition)
-                            print(f"✅ Issue {new_issue.key} moved to 'To Do' status")
-                            final_status = "To Do"
-                        else:
-                            print(f"ℹ️  Issue {new_issue.key} remains in default status")
-                            final_status = "Default"
-                            
-                    except Exception as transition_error:
-                        # If we can't set the status, at least the ticket was created
-                        print(f"⚠️  Issue {new_issue.key} created but couldn't change status: {transition_error}")
-                        final_status = "Default"
-                
-                ticket_info['status'] = final_status
-                created_tickets.append(new_issue.key)
+                        batch_results, auth_error = create_jira_tickets_batch(executor, jira, server, project_key, batch, issue_type,
+                                                                              epic_key, status_name, number, total, cancel_event)
+                    except JIRAError as bulk_error:
+                        # Some instances disable /issue/bulk; create tickets one by one from here on
+                        print(f"⚠️  Bulk create not available ({bulk_error.status_code}), creating tickets one by one...")
+                        use_bulk = False
+                if batch_results is None:
+                    batch_results, auth_error = create_jira_tickets_individually(executor, jira, server, project_key, batch, issue_type,
+                                                                                 epic_key, status_name, number, total, cancel_event)
+                results.extend(batch_results)
+                number += len(batch)
+                if auth_error:
+                    # Every remaining ticket would fail the same way, so stop early
+                    print(f"\n⛔ Stopping: Jira rejected the request ({auth_error.status_code}). Remaining tickets were not created.")
+                    break
+        
+        # Keep the summary in document order
+        for ticket_info in results:
+            if ticket_info:
+                created_tickets.append(ticket_info['key'])
                 ticket_details.append(ticket_info)
-                
-            except Exception as create_error:
-                print(f"❌ Failed to create ticket {i}: {issue['title'][:50]}...")
-                print(f"   Error: {create_error}")
-                continue
         
         if created_tickets:
             print(f"\n🎉 Successfully created {len(created_tickets)} tickets:")
@@ -322,14 +596,14 @@ def create_jira_tickets_with_type(server, username, api_token, project_key, issu
         return created_tickets
 
     except ValueError as e:
-        print(f"\\n❌ Validation Error: {e}")
+        print(f"\n❌ Validation Error: {e}")
         return []
     except ConnectionError as e:
-        print(f"\\n❌ Connection Error: {e}")
+        print(f"\n❌ Connection Error: {e}")
         return []
     except JIRAError as e:
         # Handle specific Jira-related errors for more helpful messages
-        print(f"\\n❌ Jira Error (Status {e.status_code}):")
+        print(f"\n❌ Jira Error (Status {e.status_code}):")
         if e.status_code == 401:
             print("Authentication failed. Please check:")
             print("• Username is your EMAIL address")
@@ -353,20 +627,20 @@ def create_jira_tickets_with_type(server, username, api_token, project_key, issu
     except Exception as e:
         # Catch any other unexpected errors with more specific messages
         error_msg = str(e)
-        print(f"\\n❌ Unexpected Error: {error_msg}")
+        print(f"\n❌ Unexpected Error: {error_msg}")
         
         if "Expecting value" in error_msg:
-            print("\\n🔍 JSON parsing error - this usually means:")
+            print("\n🔍 JSON parsing error - this usually means:")
             print(f"• '{server}' is not a valid Jira API endpoint")
             print("• The server returned HTML instead of JSON (login page?)")
             print("• Network/proxy issues")
             print("• SSL/certificate problems")
-            print("\\n💡 Troubleshooting steps:")
+            print("\n💡 Troubleshooting steps:")
             print(f"1. Open '{server}' in your browser - does it show Jira?")
             print(f"2. Try '{server}/rest/api/2/serverInfo' - does it show JSON?")
             print("3. Check if you need VPN or special network access")
         elif "Connection" in error_msg or "timeout" in error_msg.lower():
-            print(f"\\n🔍 Network connection failed:")
+            print(f"\n🔍 Network connection failed:")
             print("• Check your internet connection")
             print("• Verify the server URL is correct")
             print("• Check if VPN is required")
@@ -127,7 +127,11 @@ def get_enhanced_text_with_images(filename):
 
 def parse_enhanced_issues(content_blocks, extracted_images):
     """Parse content blocks into structured issues with image references"""
-    issues = []
+    return list(iter_enhanced_issues(content_blocks, extracted_images))
+
+def iter_enhanced_issues(content_blocks, extracted_images):
+    """Yield structured issues with image references one by one, as soon as each issue's blocks are complete"""
+    issue_count = 0
     current_issue = None
     
     for block in content_blocks:
@@ -146,13 +150,14 @@ def parse_enhanced_issues(content_blocks, extracted_images):
              'problem' in content.lower() or
              'error' in content.lower() or
              content.endswith(':') or
-             len(issues) == 0)  # First issue
+             issue_count == 0)  # First issue
         )
         
         if is_new_issue or current_issue is None:
-            # Start new issue
+            # Start new issue (the previous one is finished)
             if current_issue:
-                issues.append(current_issue)
+                yield format_enhanced_issue(current_issue)
+                issue_count += 1
             
             current_issue = {
                 'title': content[:100] + ('...' if len(content) > 100 else ''),
@@ -172,26 +177,23 @@ def parse_enhanced_issues(content_blocks, extracted_images):
     
     # Add the last issue
     if current_issue:
-        issues.append(current_issue)
+        yield format_enhanced_issue(current_issue)
+
+def format_enhanced_issue(issue):
+    """Format a collected issue into its final title/description/images form"""
+    description = "\\n\\n".join(issue['description_parts'])
     
-    # Format final issues
-    formatted_issues = []
-    for issue in issues:
-        description = "\\n\\n".join(issue['description_parts'])
-        
-        # Add image references to description
-        if issue['images']:
-            description += "\\n\\n📸 **Attached Images:**\\n"
-            for img in issue['images']:
-                description += f"- {img['filename']} ({img['size']} bytes)\\n"
-        
-        formatted_issues.append({
-            'title': issue['title'],
-            'description': description,
-            'images': issue['images']
-        })
+    # Add image references to description
+    if issue['images']:
+        description += "\\n\\n📸 **Attached Images:**\\n"
+        for img in issue['images']:
+            description += f"- {img['filename']} ({img['size']} bytes)\\n"
     
-    return formatted_issues
+    return {
+        'title': issue['title'],
+        'description': description,
+        'images': issue['images']
+    }
 
 def test_extraction():
     """Test the enhanced extraction on your Word document"""
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""
+Basic authentication for Jira sessions with the Authorization header encoded once
+"""
+from base64 import b64encode
+from requests.auth import AuthBase
+
+class PrebuiltBasicAuth(AuthBase):
+    """
+    Basic auth that sets an Authorization header built once, instead of re-encoding the
+    credentials for every request like requests' HTTPBasicAuth does.
+
+    It stays set as session.auth (rather than a plain session header) so requests keeps
+    skipping its per-request ~/.netrc lookup.
+    """
+
+    def __init__(self, username, api_token):
+        credentials = b64encode(f"{username}:{api_token}".encode("utf-8")).decode("ascii")
+        self.header = f"Basic {credentials}"
+
+    def __call__(self, request):
+        request.headers["Authorization"] = self.header
+        return request
+
+def use_prebuilt_basic_auth(session, username, api_token):
+    """Replaces the session's basic auth with a PrebuiltBasicAuth for the same credentials"""
+    session.auth = PrebuiltBasicAuth(username, api_token)
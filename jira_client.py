@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Jira clients shared by the GUI and the command line scripts
+"""
+from jira import JIRA
+from jira_basic_auth import use_prebuilt_basic_auth
+from jira_rate_limit import mount_rate_limited_adapter
+
+# Keep-alive connection pool sizes used unless the caller asks for others
+POOL_CONNECTIONS = 10
+POOL_MAXSIZE = 20
+
+# Clients made by get_jira, by (server, username, api_token)
+_clients = {}
+
+def connect(server, username, api_token, pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE):
+    """
+    Connects a new Jira client whose session is pooled, rate limited and sends a prebuilt auth header.
+
+    Args:
+        server (str): The URL of the Jira instance.
+        username (str): The user's email for Jira authentication.
+        api_token (str): The user's Jira API token.
+        pool_connections (int): How many hosts keep a connection pool.
+        pool_maxsize (int): How many keep-alive connections each pool holds (at least the worker count).
+
+    Returns:
+        JIRA: The connected client.
+    """
+    # Retries are left to the RateLimitedAdapter alone; the jira session's own retries
+    # (up to 3, with long waits) would stack on top of them
+    jira = JIRA(server=server.rstrip('/'), basic_auth=(username, api_token), max_retries=0)
+    # Keep TLS connections warm between calls, and pace every thread using the client together
+    mount_rate_limited_adapter(jira._session, pool_connections, pool_maxsize)
+    # Encode the credentials once rather than on every request
+    use_prebuilt_basic_auth(jira._session, username, api_token)
+    return jira
+
+def get_jira(server, username, api_token):
+    """Returns a Jira client for the credentials, reusing the one already connected"""
+    key = (server.rstrip('/'), username, api_token)
+    if key not in _clients:
+        _clients[key] = connect(*key)
+    return _clients[key]
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+HTTP adapter that keeps Jira clients within Jira's rate limits
+
+It is the only layer that retries rate limited requests: clients made by jira_client.connect
+turn the jira session's own retries off.
+"""
+import threading
+import time
+from requests.adapters import HTTPAdapter
+
+# Responses meaning Jira refused the request without handling it, so it is safe to send again:
+# 429 (rate limited) and 503 (temporarily unavailable)
+RETRY_STATUSES = {429, 503}
+
+# How many times a refused request is sent again
+RATE_LIMIT_RETRIES = 3
+
+# Wait in seconds after a refusal that has no Retry-After header (doubled each retry)
+RATE_LIMIT_BACKOFF = 1.0
+
+# Longest wait in seconds honoured from a Retry-After header, so no worker sleeps for minutes
+RATE_LIMIT_MAX_WAIT = 60.0
+
+# Requests are spaced out once Jira reports fewer than this many left in the current window
+RATE_LIMIT_LOW_WATERMARK = 5
+
+def _header_float(response, name):
+    """Returns a numeric response header, or None when it is missing or not a number"""
+    try:
+        return float(response.headers[name])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that paces requests using Jira's X-RateLimit-* headers and retries 429/503 responses.
+
+    One adapter is shared by every thread using the session, so a rate limit seen by one request
+    holds back all of them instead of each thread running into its own 429.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._rate_lock = threading.Lock()
+        # Seconds to leave between requests while the remaining allowance is low
+        self._spacing = 0.0
+        # time.monotonic() before which no request may be sent
+        self._next_send = 0.0
+
+    def send(self, request, **kwargs):
+        delay = RATE_LIMIT_BACKOFF
+        for attempt in range(RATE_LIMIT_RETRIES + 1):
+            self._wait_for_turn()
+            response = super().send(request, **kwargs)
+            self._update_spacing(response)
+
+            # Streamed bodies (attachments) are consumed by the first send and can't be replayed
+            replayable = request.body is None or isinstance(request.body, (bytes, str))
+            if response.status_code not in RETRY_STATUSES or attempt == RATE_LIMIT_RETRIES or not replayable:
+                return response
+
+            # Prefer the server's own hint when it sends one
+            wait = _header_float(response, 'Retry-After')
+            if wait is None:
+                wait = delay
+                delay *= 2
+            wait = min(wait, RATE_LIMIT_MAX_WAIT)
+            response.close()
+            with self._rate_lock:
+                self._next_send = max(self._next_send, time.monotonic() + wait)
+
+    def _wait_for_turn(self):
+        """Blocks until this request may be sent, reserving the next slot for the following one"""
+        with self._rate_lock:
+            now = time.monotonic()
+            send_at = max(now, self._next_send)
+            self._next_send = send_at + self._spacing
+        if send_at > now:
+            time.sleep(send_at - now)
+
+    def _update_spacing(self, response):
+        """Derives the gap between requests from the rate limit headers of a response"""
+        remaining = _header_float(response, 'X-RateLimit-Remaining')
+        interval = _header_float(response, 'X-RateLimit-Interval-Seconds')
+        fill_rate = _header_float(response, 'X-RateLimit-FillRate')
+        if remaining is None or not interval or not fill_rate:
+            return
+
+        # While the allowance is low, send no faster than Jira refills it
+        with self._rate_lock:
+            self._spacing = interval / fill_rate if remaining < RATE_LIMIT_LOW_WATERMARK else 0.0
+
+def mount_rate_limited_adapter(session, pool_connections=10, pool_maxsize=20):
+    """Mounts one shared RateLimitedAdapter on the session for http and https and returns it"""
+    adapter = RateLimitedAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return adapter
@@ -2,24 +2,279 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
 import threading
 import sys
-from create_jira_tickets import parse_issues, create_jira_tickets, get_text, create_jira_tickets_with_type, get_enhanced_issues
-from jira import JIRAError
+import importlib.util
+import json
+import os
+import queue
+import re
+import time
+from collections import OrderedDict
+from textwrap import shorten
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Optional
 
-# Import AI analyzer
-try:
-    from ai_document_analyzer import get_ai_enhanced_issues, is_ai_available
-    AI_AVAILABLE = True
-except ImportError:
-    AI_AVAILABLE = False
-    print("⚠️  AI document analyzer not available. Install OpenAI package: pip install openai")
+# Heavy modules (jira, openai, python-docx and the analyzers built on them) are
+# imported lazily inside the methods that need them so the window paints fast.
+# Availability is detected without importing anything.
+AI_AVAILABLE = importlib.util.find_spec("openai") is not None
+COMPREHENSIVE_AVAILABLE = importlib.util.find_spec("docx") is not None
 
-# Import comprehensive analyzer
-try:
-    from comprehensive_document_analyzer import get_comprehensive_issues
-    COMPREHENSIVE_AVAILABLE = True
-except ImportError:
-    COMPREHENSIVE_AVAILABLE = False
-    print("⚠️  Comprehensive document analyzer not available.")
+def is_ai_available():
+    """Check if AI analysis is available (imports the AI analyzer on first call)."""
+    if not AI_AVAILABLE:
+        return False
+    try:
+        from ai_document_analyzer import is_ai_available as _is_ai_available
+    except ImportError:
+        return False
+    return _is_ai_available()
+
+def load_project_options(jira):
+    """Returns the project dropdown options: the default option followed by every project key."""
+    project_options = ["Select Project..."]  # Default option
+    for project in jira.projects():
+        project_options.append(project.key)
+    return project_options
+
+def load_epic_options(jira, project_key):
+    """Returns the epic dropdown options for a project: "None" followed by "KEY: summary" entries."""
+    jql = f'project = "{project_key}" AND issuetype = Epic ORDER BY summary ASC'
+    
+    epic_options = ["None"]  # Default option
+    start_at = 0
+    while True:
+        # Only the summary is shown, so don't download every other field of every epic
+        epics = jira.search_issues(jql, startAt=start_at, maxResults=EPIC_PAGE_SIZE, fields="summary")
+        for epic in epics:
+            epic_options.append(f"{epic.key}: {epic.fields.summary}")
+        start_at += len(epics)
+        # The server may cap maxResults below EPIC_PAGE_SIZE, so a short page isn't the end; total is
+        if not epics or start_at >= epics.total:
+            return epic_options
+
+def load_status_options(jira, project_key):
+    """Returns the sorted, de-duplicated status names, after checking the project exists."""
+    from create_jira_tickets import get_project
+    
+    # Get project information (raises a 404 JIRAError for an unknown project); creating tickets reuses it
+    get_project(jira, project_key)
+    
+    # Get available statuses, without duplicates, sorted
+    return sorted(dict.fromkeys(status.name for status in jira.statuses()))
+
+def shorten_preview(text, width, placeholder="..."):
+    """Returns text on one line, cut at a word boundary to at most width characters."""
+    # Only the start can be shown, so collapse the whitespace of just enough words to overfill width
+    # (each is a character plus a space) rather than have shorten() split the whole of a long text.
+    # A raw slice won't do: runs of whitespace collapse, leaving it short of width with no placeholder.
+    max_words = width // 2 + 2
+    short = shorten(" ".join(text.split(None, max_words)[:max_words]), width=width, placeholder=placeholder)
+    if short == placeholder.strip() and text.strip():
+        # A single word longer than width (e.g. a URL): cut it rather than show nothing
+        return text.strip()[:width - len(placeholder)] + placeholder
+    return short
+
+# Jira API tokens (Cloud tokens and Data Center personal access tokens) are 24-200ish base64/base64url characters
+_JIRA_TOKEN_RE = re.compile(r"[A-Za-z0-9_\-+/=]{20,256}")
+_JIRA_URL_RE = re.compile(r"https?://[^\s/]+(/\S*)?")
+
+def _looks_like_jira_token(api_token):
+    """Cheap offline check that an API token could be real, so a mistyped one doesn't cost a round trip."""
+    return api_token != "YOUR_API_TOKEN_HERE" and _JIRA_TOKEN_RE.fullmatch(api_token) is not None
+
+def _looks_like_jira_url(server):
+    """Cheap offline check that the server is an http(s) URL with a host name."""
+    return _JIRA_URL_RE.fullmatch(server) is not None
+
+def default_status(status_options):
+    """Returns the status preselected in the dropdown: "To Do" when the project has it, else the first one."""
+    return "To Do" if "To Do" in status_options else status_options[0] if status_options else "To Do"
+
+def load_settings():
+    """Loads the saved GUI settings (e.g. the last used project), or an empty dict."""
+    try:
+        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_settings(settings):
+    """Saves the GUI settings, ignoring errors - they are only a convenience."""
+    try:
+        with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
+            json.dump(settings, f, indent=2)
+    except OSError:
+        pass
+
+def load_cache():
+    """Loads the cached Jira dropdown options, or an empty dict.
+    
+    Layout: {server: {"projects": item, "epics": {project_key: item}, "statuses": {project_key: item}}},
+    where each item is {"options": [...], "ts": time fetched}, so every list expires on its own.
+    """
+    try:
+        with open(CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_cache(cache):
+    """Saves the cached Jira dropdown options, ignoring errors - the cache is only a shortcut."""
+    try:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
+
+# Epics requested per search page when loading the epic dropdown
+EPIC_PAGE_SIZE = 100
+
+# Where the last used project is remembered between runs
+SETTINGS_FILE = os.path.expanduser("~/.jira_ticket_master.json")
+
+# Where fetched projects, epics and statuses are kept between runs, and for how long (seconds)
+CACHE_FILE = os.path.expanduser("~/.jira_ticket_master_cache.json")
+CACHE_TTL_SECONDS = 3600
+
+# Connection pooling for the cached Jira client (see JiraApp._get_jira)
+JIRA_POOL_CONNECTIONS = 4
+JIRA_POOL_MAXSIZE = 8
+
+# Number of parsed documents kept in memory for instant re-previews
+PARSE_CACHE_SIZE = 8
+
+# Console keys the user may still press: moving around and copying
+CONSOLE_NAV_KEYS = {"Left", "Right", "Up", "Down", "Prior", "Next", "Home", "End"}
+
+# Modifier bits of a key event that make C/A copy and select-all: Control, or Command (Mod1) on macOS
+CONSOLE_COPY_MODIFIERS = 0x4 | 0x8
+
+# Minimum time (ms) between console auto-scrolls (~30 per second)
+SCROLL_INTERVAL_MS = 33
+
+# Lines kept in the console; older ones are dropped so inserts and scrolling stay fast
+CONSOLE_MAX_LINES = 5000
+
+# How often (ms) queued console messages are written, and at most how many per pass
+LOG_DRAIN_INTERVAL_MS = 50
+LOG_DRAIN_BATCH = 256
+
+# How often (ms) tickets streamed from the parser are added to the preview
+PREVIEW_DRAIN_INTERVAL_MS = 33
+
+# Console color for redirected stdout lines, by their first character
+WRITE_PREFIX_COLORS = {"✅": "green", "🎉": "dark green", "📍": "blue", "🌐": "blue"}
+
+# Console colors: name -> (foreground, font). Each becomes a text tag of the same name.
+COLOR_MAP = {
+    "green": ("#2E7D32", None),
+    "dark green": ("#1B5E20", ("Arial", 9, "bold")),
+    "blue": ("#1565C0", None),
+    "red": ("#C62828", None),
+}
+
+# Tags argument for Text.insert by console color; a tuple, so "dark green" stays one tag name
+_COLOR_TAGS = {color: (color,) for color in COLOR_MAP}
+
+# Shown in a dropdown while its options are fetched; never a real project, epic or status
+COMBO_LOADING_TEXT = "🔄 Loading..."
+
+# Number of description characters shown per ticket in the console preview
+DESC_PREVIEW_LENGTH = 200
+
+# Help shown under the Analysis Mode dropdown, one mode per line
+_ANALYSIS_HELP_TEXT = (
+    "ℹ️ AI-Powered: Uses OpenAI to intelligently extract tasks\n"
+    "Enhanced: Extracts text + images\n"
+    "Basic: Simple text parsing\n"
+    "Comprehensive: Analyzes document content and structure"
+)
+
+# Checkbox glyphs used in the ticket selection list
+CHECKED_GLYPH = "☑"
+UNCHECKED_GLYPH = "☐"
+
+# Ticket rows inserted per event-loop pass; the first pass fills the visible list at once
+TICKET_ROW_CHUNK = 50
+
+class QueueWriter:
+    """A stdout stand-in that queues printed lines for the GUI console instead of touching Tk.
+    
+    Safe to write from any thread: the Tk thread writes the queued lines in JiraApp._drain_log_queue.
+    """
+    
+    def __init__(self, log_queue):
+        self.log_queue = log_queue
+    
+    def write(self, message):
+        """Queues a printed message as a (text, color) console line."""
+        # Avoid printing empty lines (print() sends the trailing newline as its own write)
+        text = message.strip()
+        if not text:
+            return
+        
+        # Color by leading emoji: ✅ ticket lines with details, 🎉 major success, 📍/🌐 project/URL info
+        color = WRITE_PREFIX_COLORS.get(text[:1])
+        if color == "green" and ":" not in text:
+            color = None
+        if color != "green" and "Successfully created" in text:
+            color = "dark green"
+        self.log_queue.put((text, color))
+    
+    def flush(self):
+        """A required method for the stdout interface."""
+        pass
+
+class DaemonWorkers:
+    """Long-lived daemon worker threads fed by a queue.Queue; submit() returns a concurrent.futures.Future.
+
+    Unlike ThreadPoolExecutor's threads, which the interpreter joins at exit, daemon threads die with
+    the process, so closing the window never waits on a running parse or a stalled Jira request.
+    """
+
+    def __init__(self, max_workers, thread_name_prefix):
+        self._jobs = queue.Queue()
+        for i in range(max_workers):
+            threading.Thread(target=self._work, name=f"{thread_name_prefix}_{i}", daemon=True).start()
+
+    def submit(self, func, *args):
+        """Queues func(*args) for the next free worker and returns its Future."""
+        future = Future()
+        self._jobs.put((future, func, args))
+        return future
+
+    def shutdown(self):
+        """Cancels the jobs still queued; running ones are abandoned when the process exits."""
+        try:
+            while True:
+                self._jobs.get_nowait()[0].cancel()
+        except queue.Empty:
+            pass
+
+    def _work(self):
+        """Runs queued jobs one after another, forever."""
+        while True:
+            future, func, args = self._jobs.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = func(*args)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+@dataclass(slots=True)
+class JiraForm:
+    """Snapshot of the form fields, read once on the Tk thread and handed to the creation worker."""
+    server: str
+    username: str
+    api_token: str
+    project_key: str
+    issue_type: str
+    epic_key: Optional[str]
+    status: Optional[str]
 
 # Import configuration
 try:
@@ -35,6 +290,10 @@ except ImportError:
 
 class JiraApp:
     """A simple Tkinter GUI application for creating Jira tickets from a Word document."""
+
+    # How many tickets are created in Jira at the same time
+    MAX_UPLOAD_WORKERS = 5
+
     def __init__(self, root):
         """Initializes the main application window and its widgets."""
         self.root = root
@@ -54,9 +313,12 @@ class JiraApp:
         # Default values for the fields
         default_values = [DEFAULT_JIRA_SERVER, DEFAULT_JIRA_USERNAME, DEFAULT_JIRA_API_TOKEN]
 
+        # Grid row of the next widget line; every line below takes the next one
+        row = 0
+
         for i, label_text in enumerate(labels):
             label = tk.Label(input_frame, text=label_text)
-            label.grid(row=i, column=0, sticky="w", padx=5, pady=5)
+            label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
             entry = tk.Entry(input_frame, width=50)
             # Hide text for the API token field
             if "token" in label_text.lower():
@@ -66,86 +328,96 @@ class JiraApp:
             if i < len(default_values) and default_values[i]:
                 entry.insert(0, default_values[i])
                 
-            entry.grid(row=i, column=1, sticky="ew", padx=5, pady=5)
+            entry.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+            entry.bind("<FocusOut>", self.on_credentials_changed)
             self.entries[label_text] = entry
+            row += 1
         
         # Project Key dropdown
         project_label = tk.Label(input_frame, text="Project Key:")
-        project_label.grid(row=len(labels), column=0, sticky="w", padx=5, pady=5)
+        project_label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         self.project_var = tk.StringVar(value="Select Project...")
         self.project_combo = ttk.Combobox(input_frame, textvariable=self.project_var, 
                                          values=["Select Project..."], state="readonly", width=47)
-        self.project_combo.grid(row=len(labels), column=1, sticky="ew", padx=5, pady=5)
+        self.project_combo.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+        row += 1
+        self.project_combo.bind("<<ComboboxSelected>>", self.remember_project)
         
         # Button to fetch projects
         fetch_projects_button = tk.Button(input_frame, text="🔄 Fetch Projects", command=self.fetch_projects, bg="#e3f2fd")
-        fetch_projects_button.grid(row=len(labels)+1, column=0, sticky="w", padx=5, pady=5)
+        fetch_projects_button.grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
         
         # Issue Type dropdown
         issue_type_label = tk.Label(input_frame, text="Issue Type:")
-        issue_type_label.grid(row=len(labels)+2, column=0, sticky="w", padx=5, pady=5)
+        issue_type_label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         self.issue_type_var = tk.StringVar(value="Task")
         issue_type_combo = ttk.Combobox(input_frame, textvariable=self.issue_type_var, 
                                        values=["Task", "Story", "Bug", "Epic"], state="readonly", width=47)
-        issue_type_combo.grid(row=len(labels)+2, column=1, sticky="ew", padx=5, pady=5)
+        issue_type_combo.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+        row += 1
         
         # Epic dropdown
         epic_label = tk.Label(input_frame, text="Epic:")
-        epic_label.grid(row=len(labels)+3, column=0, sticky="w", padx=5, pady=5)
+        epic_label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         self.epic_var = tk.StringVar(value="None")
         self.epic_combo = ttk.Combobox(input_frame, textvariable=self.epic_var, 
                                       values=["None"], state="readonly", width=47)
-        self.epic_combo.grid(row=len(labels)+3, column=1, sticky="ew", padx=5, pady=5)
+        self.epic_combo.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+        row += 1
         
         # Button to fetch epics (moved to be right under Epic field)
         fetch_epics_button = tk.Button(input_frame, text="🔄 Fetch Epics", command=self.fetch_epics, bg="#f0f0f0")
-        fetch_epics_button.grid(row=len(labels)+4, column=0, sticky="w", padx=5, pady=5)
+        fetch_epics_button.grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
         
         # Status dropdown
         status_label = tk.Label(input_frame, text="Initial Status:")
-        status_label.grid(row=len(labels)+5, column=0, sticky="w", padx=5, pady=5)
+        status_label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         self.status_var = tk.StringVar(value="To Do")
         self.status_combo = ttk.Combobox(input_frame, textvariable=self.status_var, 
                                         values=["To Do", "In Progress", "Done", "Backlog"], state="readonly", width=47)
-        self.status_combo.grid(row=len(labels)+5, column=1, sticky="ew", padx=5, pady=5)
+        self.status_combo.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+        row += 1
         
         # Button to fetch statuses
         fetch_statuses_button = tk.Button(input_frame, text="🔄 Fetch Statuses", command=self.fetch_statuses, bg="#e8f5e8")
-        fetch_statuses_button.grid(row=len(labels)+6, column=0, sticky="w", padx=5, pady=5)
+        fetch_statuses_button.grid(row=row, column=0, sticky="w", padx=5, pady=5)
+        row += 1
         
         # Analysis Mode selection
         analysis_label = tk.Label(input_frame, text="Analysis Mode:")
-        analysis_label.grid(row=len(labels)+7, column=0, sticky="w", padx=5, pady=5)
-        self.analysis_mode_var = tk.StringVar(value="Enhanced" if AI_AVAILABLE and is_ai_available() else "Basic")
+        analysis_label.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         
-        # Create analysis mode options based on availability
+        # Options come from installed packages only; the OpenAI setup is checked when AI-Powered is picked
         analysis_options = ["Basic"]
         if AI_AVAILABLE:
-            if is_ai_available():
-                analysis_options.append("AI-Powered")
-                analysis_options.append("Enhanced")  # Previous enhanced extraction
-            else:
-                analysis_options.append("AI-Powered (Configure API Key)")
+            analysis_options.append("AI-Powered")
+            analysis_options.append("Enhanced")  # Previous enhanced extraction
         if COMPREHENSIVE_AVAILABLE:
             analysis_options.append("Comprehensive")
-        
-        analysis_combo = ttk.Combobox(input_frame, textvariable=self.analysis_mode_var, 
+        self.analysis_mode_var = tk.StringVar(value="Enhanced" if "Enhanced" in analysis_options else "Basic")
+        self.analysis_combo = ttk.Combobox(input_frame, textvariable=self.analysis_mode_var, 
                                      values=analysis_options, state="readonly", width=47)
-        analysis_combo.grid(row=len(labels)+7, column=1, sticky="ew", padx=5, pady=5)
+        self.analysis_combo.grid(row=row, column=1, sticky="ew", padx=5, pady=5)
+        self.analysis_combo.bind("<<ComboboxSelected>>", self.on_analysis_mode_selected)
+        row += 1
         
         # Add tooltip/help text
-        analysis_help = tk.Label(input_frame, text="ℹ️ AI-Powered: Uses OpenAI to intelligently extract tasks | Enhanced: Extracts text + images | Basic: Simple text parsing | Comprehensive: Analyzes document content and structure", 
-                               font=("Arial", 8), fg="gray", wraplength=400, justify="left")
-        analysis_help.grid(row=len(labels)+8, column=0, columnspan=2, sticky="w", padx=5, pady=(0,5))
+        analysis_help = tk.Message(input_frame, text=_ANALYSIS_HELP_TEXT, width=400,
+                                   font=("Arial", 8), fg="gray", justify="left")
+        analysis_help.grid(row=row, column=0, columnspan=2, sticky="w", padx=5, pady=(0,5))
+        row += 1
         
         # Make the entry column expandable
         input_frame.grid_columnconfigure(1, weight=1)
 
         # File selection widgets
         self.file_path_label = tk.Label(input_frame, text="No file selected.")
-        self.file_path_label.grid(row=len(labels)+9, column=1, sticky="w", padx=5, pady=5)
-        browse_button = tk.Button(input_frame, text="Browse for Word Doc", command=self.browse_file)
-        browse_button.grid(row=len(labels)+9, column=0, sticky="w", padx=5, pady=5)
+        self.file_path_label.grid(row=row, column=1, sticky="w", padx=5, pady=5)
+        # Disabled while a preview is parsing, so a new file can't mix with the old one's tickets
+        self.browse_button = tk.Button(input_frame, text="Browse for Word Doc", command=self.browse_file)
+        self.browse_button.grid(row=row, column=0, sticky="w", padx=5, pady=5)
         self.selected_file = None
 
         # Button frame for actions
@@ -161,9 +433,19 @@ class JiraApp:
         self.create_button.pack(side=tk.LEFT, padx=5)
         self.create_button.config(state="disabled")  # Disabled until preview is done
 
+        # Clear Cache button, forgets the projects, epics and statuses remembered between runs
+        clear_cache_button = tk.Button(button_frame, text="🗑 Clear Cache", command=self.clear_cache, width=12)
+        clear_cache_button.pack(side=tk.RIGHT, padx=5)
+
+        # Cancel button, enabled while a preview is parsing or tickets are being created
+        self.cancel_button = tk.Button(button_frame, text="⛔ Cancel", command=self.cancel_running_job, width=10, state="disabled")
+        self.cancel_button.pack(side=tk.LEFT, padx=5)
+
         # Status label
         self.status_label = tk.Label(root, text="📁 Select a Word document and click 'Preview Tickets' to start", fg="blue")
         self.status_label.pack(pady=5)
+        self._status_pending = None  # Latest (text, fg) waiting to be drawn
+        self._status_after_id = None
 
         # Placeholder for ticket selection frame (will be inserted here)
         self.ticket_selection_container = tk.Frame(root)
@@ -173,31 +455,261 @@ class JiraApp:
         console_label = tk.Label(root, text="Preview / Output Console:", anchor="w")
         console_label.pack(fill="x", padx=10, pady=(10,0))
         
-        self.output_console = scrolledtext.ScrolledText(root, height=20, state="disabled")
+        self.output_console = scrolledtext.ScrolledText(root, height=20)
         self.output_console.pack(padx=10, pady=5, fill="both", expand=True)
         
+        # The console stays in the normal state (so logging needs no state flips) and is made
+        # read-only for the user by swallowing editing keys and pastes instead
+        self.output_console.bind("<Key>", self._block_console_edit)
+        for sequence in ("<<Paste>>", "<<Cut>>", "<<Clear>>", "<<PasteSelection>>"):
+            self.output_console.bind(sequence, lambda event: "break")
+        self._scroll_pending = False
+        
+        # Color tags used by log_many_colored, configured once
+        for color, (foreground, font) in COLOR_MAP.items():
+            if font:
+                self.output_console.tag_config(color, foreground=foreground, font=font)
+            else:
+                self.output_console.tag_config(color, foreground=foreground)
+        
         # Store parsed issues for later use
         self.parsed_issues = []
         
-        # Store ticket selection variables
-        self.ticket_selection_vars = []
+        # Messages from worker threads (including redirected stdout), written by _drain_log_queue
+        self._log_queue = queue.Queue()
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+        
+        # Ticket selection state: bit i of _selection_bits is set when ticket i is checked
+        self._ticket_count = 0
+        self._selection_bits = 0
+        self._rows_inserted = 0  # Rows are added to the list in chunks (see insert_ticket_rows)
+        self._row_fill_id = None
         self.ticket_selection_frame = None
+        self.ticket_tree = None
+        
+        # Parsed issues of recently previewed documents, keyed by (analysis mode, path, mtime, size)
+        self._parse_cache = OrderedDict()
+        self._parse_cache_lock = threading.Lock()
+        
+        # Long-lived worker pool for document parsing and prefetching so the Tk thread never blocks
+        self._pool = DaemonWorkers(max_workers=4, thread_name_prefix="jira-gui")
+        
+        # Single long-lived worker that runs ticket creation jobs one after another
+        self._creation_pool = DaemonWorkers(max_workers=1, thread_name_prefix="jira-create")
+        self._cancel_creation = threading.Event()
+        
+        # Set by on_close; workers finishing after that must not schedule anything on the dead root
+        self._closing = False
+        
+        # The running preview parse, the queue its issues stream through, and its stop flag
+        self._preview_future = None
+        self._preview_q = queue.Queue()
+        self._cancel_preview = threading.Event()
+        
+        # Set while a dropdown's options are being fetched, so repeated clicks don't overlap
+        self._fetching = {name: threading.Event() for name in ("projects", "epics", "statuses")}
+        
+        # Values last given to each dropdown by update_combo_values, to skip identical updates
+        self._combo_values = {}
+        
+        # Jira client shared by the worker threads (see _get_jira)
+        self._jira_client = None
+        self._jira_creds_key = None
+        self._jira_lock = threading.Lock()
+        
+        # Settings remembered between runs
+        self.settings = load_settings()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        
+        # Show the dropdown options seen last time straight away; auto_fetch_projects refreshes them
+        self.cache = load_cache()
+        self.apply_cached_options()
         
         # Auto-fetch projects if credentials are available
         self.root.after(500, self.auto_fetch_projects)  # Delay to ensure GUI is fully loaded
     
+    def on_analysis_mode_selected(self, event=None):
+        """Checks the OpenAI setup (importing the AI analyzer) only once AI-Powered is actually picked."""
+        if self.analysis_mode_var.get() == "AI-Powered" and not is_ai_available():
+            self.log_message("⚠️  AI-Powered analysis needs an OpenAI API key. Please configure it in config.py")
+            self._queue_status("⚠️  Configure your OpenAI API key in config.py to use AI-Powered analysis", "orange")
+    
+    def on_close(self):
+        """Stops the worker pools and closes the window.
+        
+        Running jobs can't be interrupted, so they are asked to stop: creation after the tickets in
+        flight, parsing at the next ticket. Their callbacks see _closing and leave Tk alone, and the
+        workers are daemon threads, so the process exits with the window without waiting for them.
+        """
+        self._closing = True
+        self._cancel_creation.set()
+        self._cancel_preview.set()
+        self._pool.shutdown()
+        self._creation_pool.shutdown()
+        self.root.destroy()
+    
+    def _call_on_tk(self, func, *args):
+        """Runs func(*args) on the Tk thread soon; safe from any thread, and a no-op once the window is closing."""
+        if self._closing:
+            return
+        try:
+            self.root.after(0, func, *args)
+        except (tk.TclError, RuntimeError):
+            # The window was destroyed between the check and the call
+            pass
+    
     def auto_fetch_projects(self):
         """Automatically fetch projects if credentials are pre-filled."""
         server = self.entries["Jira Server URL:"].get().strip()
         username = self.entries["Jira Username:"].get().strip()
         api_token = self.entries["API Token:"].get().strip()
         
-        # Only auto-fetch if all credentials are filled and API token is not the default placeholder
-        if (all([server, username, api_token]) and 
-            api_token != "YOUR_API_TOKEN_HERE" and 
-            len(api_token) > 10):  # Basic validation for real API token
-            self.log_message("🚀 Auto-fetching projects with stored credentials...")
-            self.fetch_projects()
+        # Only auto-fetch if all credentials are filled and look real (not e.g. the default placeholder)
+        if username and _looks_like_jira_url(server) and _looks_like_jira_token(api_token):
+            project_key = self.settings.get("last_project_key")
+            if not project_key:
+                self.log_message("🚀 Auto-fetching projects with stored credentials...")
+                self.fetch_projects()
+                return
+            
+            # A project was used last time: load projects, epics and statuses concurrently, through the
+            # same bookkeeping as the fetch buttons so a click during startup doesn't start a second fetch
+            self.log_message(f"🚀 Auto-fetching projects, epics and statuses for {project_key}...")
+            # Epics and statuses go first: they read the project from the dropdown, which
+            # shows a loading placeholder once the project fetch has started
+            self.project_var.set(project_key)
+            self.fetch_epics(quiet=True)
+            self.fetch_statuses(quiet=True)
+            self.fetch_projects(quiet=True)
+    
+    def _get_jira(self, server, username, api_token):
+        """Returns a Jira client for the given credentials, reusing the cached one when they are unchanged.
+        
+        Safe to call from worker threads; once connected, callers share one pooled session, so TLS and
+        authentication are negotiated again only when the credentials change.
+        """
+        from jira_client import connect
+        
+        creds_key = (server.rstrip('/'), username, api_token)
+        with self._jira_lock:
+            if self._jira_client is not None and self._jira_creds_key == creds_key:
+                return self._jira_client
+        
+        # Connect outside the lock: it is a network round trip, and on_credentials_changed
+        # takes the lock on the Tk thread. Keep enough keep-alive connections for the workers.
+        jira = connect(creds_key[0], username, api_token, JIRA_POOL_CONNECTIONS, JIRA_POOL_MAXSIZE)
+        with self._jira_lock:
+            # Another worker may have connected with the same credentials meanwhile
+            if self._jira_client is not None and self._jira_creds_key == creds_key:
+                return self._jira_client
+            # Lookups made with other credentials may not hold for these
+            self._clear_project_lookups()
+            self._jira_client = jira
+            self._jira_creds_key = creds_key
+            return jira
+    
+    def on_credentials_changed(self, event=None):
+        """Drops the cached Jira client when the credential fields no longer match it."""
+        creds_key = (self.entries["Jira Server URL:"].get().strip().rstrip('/'),
+                     self.entries["Jira Username:"].get().strip(),
+                     self.entries["API Token:"].get().strip())
+        with self._jira_lock:
+            if self._jira_client is not None and self._jira_creds_key != creds_key:
+                self._jira_client = None
+                self._jira_creds_key = None
+                self._clear_project_lookups()
+    
+    def _queue_status(self, text, fg):
+        """Sets the status line on the next idle tick, so bursts of updates cost one redraw."""
+        self._status_pending = (text, fg)
+        if self._status_after_id is None:
+            self._status_after_id = self.root.after_idle(self._flush_status)
+    
+    def _flush_status(self):
+        """Draws the most recent queued status."""
+        self._status_after_id = None
+        if self._status_pending is not None:
+            text, fg = self._status_pending
+            self._status_pending = None
+            self.status_label.config(text=text, fg=fg)
+    
+    def remember_project(self, event=None):
+        """Saves the selected project so its epics and statuses can be prefetched next time."""
+        project_key = self.project_var.get()
+        if project_key and project_key != "Select Project..." and project_key != self.settings.get("last_project_key"):
+            self.settings["last_project_key"] = project_key
+            save_settings(self.settings)
+            # Show the new project's epics and statuses from the cache, if they were fetched before
+            self.apply_cached_options()
+    
+    def cached_options(self, server, kind, project_key=None):
+        """Returns cached dropdown options ("projects", or per project "epics"/"statuses"), or None.
+        
+        Options fetched more than CACHE_TTL_SECONDS ago are dropped rather than returned.
+        """
+        entry = self.cache.get(server.rstrip('/'))
+        if not isinstance(entry, dict):
+            return None
+        holder = entry if project_key is None else entry.get(kind)
+        key = kind if project_key is None else project_key
+        item = holder.get(key) if isinstance(holder, dict) else None
+        # Items written in an older cache layout have no timestamp of their own and count as expired
+        if not isinstance(item, dict) or "ts" not in item:
+            return None
+        if time.time() - item["ts"] > CACHE_TTL_SECONDS:
+            del holder[key]
+            save_cache(self.cache)
+            return None
+        return item["options"]
+    
+    def store_cached_options(self, server, kind, options, project_key=None):
+        """Remembers fetched dropdown options ("projects", or per project "epics"/"statuses") on disk."""
+        entry = self.cache.get(server.rstrip('/'))
+        if not isinstance(entry, dict):
+            entry = self.cache[server.rstrip('/')] = {}
+        item = {"options": list(options), "ts": time.time()}
+        if project_key is None:
+            entry[kind] = item
+        else:
+            projects = entry.get(kind)
+            if not isinstance(projects, dict):
+                projects = entry[kind] = {}
+            projects[project_key] = item
+        save_cache(self.cache)
+    
+    def apply_cached_options(self):
+        """Fills the dropdowns from the cache for the current server and project, without contacting Jira."""
+        server = self.entries["Jira Server URL:"].get().strip()
+        project_key = self.project_var.get()
+        projects = self.cached_options(server, "projects")
+        if projects:
+            if project_key == "Select Project...":
+                project_key = self.settings.get("last_project_key", project_key)
+            self.update_combo_values(self.project_combo, self.project_var, projects, project_key, "Select Project...")
+            project_key = self.project_var.get()
+        epics = self.cached_options(server, "epics", project_key)
+        if epics is not None:
+            self.update_combo_values(self.epic_combo, self.epic_var, epics, self.epic_var.get(), "None")
+        statuses = self.cached_options(server, "statuses", project_key)
+        if statuses:
+            self.update_combo_values(self.status_combo, self.status_var, statuses, self.status_var.get(), default_status(statuses))
+    
+    def clear_cache(self):
+        """Forgets the cached projects, epics and statuses, and the cached project lookups."""
+        self.cache = {}
+        try:
+            os.remove(CACHE_FILE)
+        except OSError:
+            pass
+        self._clear_project_lookups()
+        self.log_message("🗑 Cache cleared - dropdowns will be fetched from Jira again.")
+    
+    def _clear_project_lookups(self):
+        """Forgets the projects looked up through create_jira_tickets.get_project."""
+        # They are only cached once create_jira_tickets has been imported
+        tickets_module = sys.modules.get("create_jira_tickets")
+        if tickets_module is not None:
+            tickets_module.clear_project_cache()
     
     def browse_file(self):
         """Opens a file dialog to select a .docx file and updates the label."""
@@ -210,237 +722,177 @@ class JiraApp:
             self.file_path_label.config(text=self.selected_file.split('/')[-1])
             # Reset the create button state when a new file is selected
             self.create_button.config(state="disabled", bg="#cccccc", fg="gray", text="2️⃣ Create in Jira")
-            self.status_label.config(text="📄 Document selected! Click 'Preview Tickets' to see what will be created", fg="green")
+            self._queue_status("📄 Document selected! Click 'Preview Tickets' to see what will be created", "green")
             self.clear_console()
             self.clear_ticket_selection()
         else:
             self.file_path_label.config(text="No file selected.")
-            self.status_label.config(text="📁 Select a Word document and click 'Preview Tickets' to start", fg="blue")
+            self._queue_status("📁 Select a Word document and click 'Preview Tickets' to start", "blue")
 
-    def fetch_projects(self):
-        """Fetch all projects from the specified Jira server."""
-        # Get credentials
-        server = self.entries["Jira Server URL:"].get().strip()
-        username = self.entries["Jira Username:"].get().strip()
-        api_token = self.entries["API Token:"].get().strip()
-        
-        if not all([server, username, api_token]):
-            messagebox.showerror("Missing Information", "Please fill in all Jira credential fields before fetching projects.")
-            return
-        
-        # Show loading state
-        original_text = self.project_combo.get()
-        self.project_combo.config(state="normal")
-        self.project_combo.delete(0, tk.END)
-        self.project_combo.insert(0, "🔄 Loading...")
-        self.project_combo.config(state="readonly")
-        self.root.update()
-        
-        try:
-            from jira import JIRA, JIRAError
-            
-            # Connect to Jira
-            jira = JIRA(server=server, basic_auth=(username, api_token))
-            
-            # Search for projects
-            projects = jira.projects()
-            
-            project_options = ["Select Project..."]  # Default option
-            for project in projects:
-                project_options.append(project.key)
-            
-            # Update dropdown
-            self.project_combo.config(values=project_options)
-            self.project_var.set("Select Project...")
-            
-            if len(projects) > 0:
-                self.log_message(f"✅ Found {len(projects)} projects.")
-                self.status_label.config(text=f"✅ Loaded {len(projects)} projects.", fg="green")
-            else:
-                self.log_message(f"ℹ️  No projects found.")
-                self.status_label.config(text=f"ℹ️  No projects found.", fg="blue")
-                
-        except JIRAError as e:
-            error_msg = f"Failed to fetch projects: {e}"
-            self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Failed to fetch projects - check credentials", fg="red")
-            messagebox.showerror("Project Fetch Error", f"Could not fetch projects from server {server}:\\n\\n{error_msg}")
-            
-        except Exception as e:
-            error_msg = f"Unexpected error fetching projects: {e}"
-            self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Error fetching projects", fg="red")
-            messagebox.showerror("Error", error_msg)
-            
-        finally:
-            # Reset dropdown state
-            self.project_combo.config(state="readonly")
+    def fetch_projects(self, quiet=False):
+        """Fetch all projects from the specified Jira server (in the background)."""
+        self._fetch_combo("projects", self.project_combo, self.project_var, load_project_options, "Select Project...",
+                          quiet=quiet)
+
+    def fetch_epics(self, quiet=False):
+        """Fetch all epics from the specified Jira project (in the background)."""
+        self._fetch_combo("epics", self.epic_combo, self.epic_var, load_epic_options, "None", needs_project=True,
+                          quiet=quiet)
+
+    def fetch_statuses(self, quiet=False):
+        """Fetch all statuses from the specified Jira project (in the background)."""
+        self._fetch_combo("statuses", self.status_combo, self.status_var, load_status_options, default_status,
+                          needs_project=True, has_placeholder=False, quiet=quiet)
 
-    def fetch_epics(self):
-        """Fetch all epics from the specified Jira project."""
+    def _fetch_combo(self, entity, combo, var, loader, default, needs_project=False, has_placeholder=True, quiet=False):
+        """Fetches a dropdown's options on the worker pool and applies them on the Tk thread.
+        
+        Args:
+            entity (str): What is fetched ("projects", "epics" or "statuses"), used in messages and as the cache key.
+            combo (ttk.Combobox): The dropdown to fill.
+            var (tk.StringVar): The dropdown's variable.
+            loader (callable): Called as loader(jira), or loader(jira, project_key) when needs_project is set.
+            default (str or callable): The value selected when the previous one is gone, or a function of the options.
+            needs_project (bool): Whether a project must be selected first.
+            has_placeholder (bool): Whether the first option is a placeholder rather than a real entry.
+            quiet (bool): Report failures in the console and status line only, without an error dialog
+                (used by the startup fetch).
+        """
         # Get credentials
         server = self.entries["Jira Server URL:"].get().strip()
         username = self.entries["Jira Username:"].get().strip()
         api_token = self.entries["API Token:"].get().strip()
-        project_key = self.project_var.get()
+        project_key = self.project_var.get() if needs_project else None
         
-        if not all([server, username, api_token, project_key]):
-            messagebox.showerror("Missing Information", "Please fill in all Jira credential fields before fetching epics.")
+        if not all([server, username, api_token]) or (needs_project and not project_key):
+            messagebox.showerror("Missing Information", f"Please fill in all Jira credential fields before fetching {entity}.")
             return
         
-        # Validate project selection
-        if project_key == "Select Project..." or not project_key:
+        # Validate project selection (the project dropdown shows the loading text while projects are fetched)
+        if needs_project and project_key in ("Select Project...", COMBO_LOADING_TEXT):
             messagebox.showerror("Project Not Selected", "Please select a project from the dropdown first.")
             return
         
-        # Show loading state
-        original_text = self.epic_combo.get()
-        self.epic_combo.config(state="normal")
-        self.epic_combo.delete(0, tk.END)
-        self.epic_combo.insert(0, "🔄 Loading...")
-        self.epic_combo.config(state="readonly")
-        self.root.update()
-        
-        try:
-            from jira import JIRA, JIRAError
-            
-            # Connect to Jira
-            jira = JIRA(server=server, basic_auth=(username, api_token))
-            
-            # Search for epics in the project
-            jql = f'project = "{project_key}" AND issuetype = Epic ORDER BY summary ASC'
-            epics = jira.search_issues(jql, maxResults=100)
-            
-            epic_options = ["None"]  # Default option
-            for epic in epics:
-                epic_display = f"{epic.key}: {epic.fields.summary}"
-                epic_options.append(epic_display)
-            
-            # Update dropdown
-            self.epic_combo.config(values=epic_options)
-            self.epic_var.set("None")
-            
-            if len(epics) > 0:
-                self.log_message(f"✅ Found {len(epics)} epics in project {project_key}")
-                self.status_label.config(text=f"✅ Loaded {len(epics)} epics from project {project_key}", fg="green")
-            else:
-                self.log_message(f"ℹ️  No epics found in project {project_key}")
-                self.status_label.config(text=f"ℹ️  No epics found in project {project_key}", fg="blue")
-                
-        except JIRAError as e:
-            error_msg = f"Failed to fetch epics: {e}"
-            self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Failed to fetch epics - check credentials", fg="red")
-            messagebox.showerror("Epic Fetch Error", f"Could not fetch epics from project {project_key}:\\n\\n{error_msg}")
-            
-        except Exception as e:
-            error_msg = f"Unexpected error fetching epics: {e}"
-            self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Error fetching epics", fg="red")
-            messagebox.showerror("Error", error_msg)
-            
-        finally:
-            # Reset dropdown state
-            self.epic_combo.config(state="readonly")
-
-    def fetch_statuses(self):
-        """Fetch all statuses from the specified Jira project."""
-        # Get credentials
-        server = self.entries["Jira Server URL:"].get().strip()
-        username = self.entries["Jira Username:"].get().strip()
-        api_token = self.entries["API Token:"].get().strip()
-        project_key = self.project_var.get()
-        
-        if not all([server, username, api_token, project_key]):
-            messagebox.showerror("Missing Information", "Please fill in all Jira credential fields before fetching statuses.")
+        # Catch obviously wrong credentials before spending a TLS and auth round trip on them
+        if not _looks_like_jira_url(server):
+            self._queue_status("❌ Jira Server URL should look like https://your-company.atlassian.net", "red")
+            return
+        if not _looks_like_jira_token(api_token):
+            self._queue_status("❌ API Token doesn't look like a Jira API token - check it was pasted in full", "red")
             return
         
-        # Validate project selection
-        if project_key == "Select Project..." or not project_key:
-            messagebox.showerror("Project Not Selected", "Please select a project from the dropdown first.")
+        # Ignore repeated clicks while a fetch for this dropdown is running
+        if self._fetching[entity].is_set():
             return
+        self._fetching[entity].set()
         
         # Show loading state
-        original_text = self.status_combo.get()
-        self.status_combo.config(state="normal")
-        self.status_combo.delete(0, tk.END)
-        self.status_combo.insert(0, "🔄 Loading...")
-        self.status_combo.config(state="readonly")
-        self.root.update()
+        original_text = combo.get()
+        self.show_combo_loading(combo)
+        
+        def work():
+            # Runs on a worker thread and only talks to Jira (reusing the cached client)
+            jira = self._get_jira(server, username, api_token)
+            return loader(jira, project_key) if needs_project else loader(jira)
         
+        future = self._pool.submit(work)
+        future.add_done_callback(lambda f: self._call_on_tk(
+            self._apply_combo_result, entity, combo, var, default, has_placeholder, server, project_key, original_text, f, quiet))
+    
+    def _apply_combo_result(self, entity, combo, var, default, has_placeholder, server, project_key, original_text, future, quiet=False):
+        """Fills a dropdown with fetched options and reports the outcome. Runs on the Tk thread."""
+        from jira import JIRAError
+        
+        where = f" in project {project_key}" if project_key else ""
         try:
-            from jira import JIRA, JIRAError
-            
-            # Connect to Jira
-            jira = JIRA(server=server, basic_auth=(username, api_token))
-            
-            # Get project information
-            project = jira.project(project_key)
-            
-            # Get available statuses for the project
-            statuses = jira.statuses()
-            
-            status_options = []
-            for status in statuses:
-                status_options.append(status.name)
+            options = future.result()
+            count = len(options) - 1 if has_placeholder else len(options)  # Minus the default option
+            self.store_cached_options(server, entity, options, project_key)
             
-            # Remove duplicates and sort
-            status_options = sorted(list(set(status_options)))
-            
-            # Update dropdown
-            self.status_combo.config(values=status_options)
-            self.status_var.set("To Do" if "To Do" in status_options else status_options[0] if status_options else "To Do")
+            # Update dropdown (skipped when the list is unchanged)
+            default_value = default(options) if callable(default) else default
+            if not self.update_combo_values(combo, var, options, original_text, default_value):
+                self.log_message(f"ℹ️  {entity.capitalize()} unchanged{where} ({count} {entity}).")
+                self._queue_status(f"✅ {entity.capitalize()} up to date{where}", "green")
+                return
             
-            if len(status_options) > 0:
-                self.log_message(f"✅ Found {len(status_options)} statuses: {', '.join(status_options)}")
-                self.status_label.config(text=f"✅ Loaded {len(status_options)} statuses from Jira", fg="green")
+            if count > 0:
+                self.log_message(f"✅ Found {count} {entity}{where}")
+                self._queue_status(f"✅ Loaded {count} {entity}{where}", "green")
             else:
-                self.log_message(f"ℹ️  No statuses found, using defaults")
-                self.status_label.config(text=f"ℹ️  Using default statuses", fg="blue")
+                self.log_message(f"ℹ️  No {entity} found{where}")
+                self._queue_status(f"ℹ️  No {entity} found{where}", "blue")
                 
         except JIRAError as e:
-            error_msg = f"Failed to fetch statuses: {e}"
+            error_msg = f"Failed to fetch {entity}: {e}"
             self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Failed to fetch statuses - check credentials", fg="red")
-            messagebox.showerror("Status Fetch Error", f"Could not fetch statuses from Jira:\\n\\n{error_msg}")
+            self._queue_status(f"❌ Failed to fetch {entity} - check credentials", "red")
+            if not quiet:
+                messagebox.showerror("Fetch Error", f"Could not fetch {entity}{where or f' from server {server}'}:\n\n{error_msg}")
             
         except Exception as e:
-            error_msg = f"Unexpected error fetching statuses: {e}"
+            error_msg = f"Unexpected error fetching {entity}: {e}"
             self.log_message(f"❌ {error_msg}")
-            self.status_label.config(text="❌ Error fetching statuses", fg="red")
-            messagebox.showerror("Error", error_msg)
+            self._queue_status(f"❌ Error fetching {entity}", "red")
+            if not quiet:
+                messagebox.showerror("Error", error_msg)
             
         finally:
             # Reset dropdown state
-            self.status_combo.config(state="readonly")
+            self.restore_combo(combo, var, original_text)
+            self._fetching[entity].clear()
+
+    def show_combo_loading(self, combo):
+        """Shows a loading placeholder in a dropdown while its options are fetched."""
+        combo.config(state="normal")
+        combo.delete(0, tk.END)
+        combo.insert(0, COMBO_LOADING_TEXT)
+        combo.config(state="readonly")
+    
+    def restore_combo(self, combo, var, original_text):
+        """Puts back the previous selection if a fetch left the loading placeholder in place."""
+        if var.get() == COMBO_LOADING_TEXT:
+            var.set(original_text)
+        combo.config(state="readonly")
+
+    def update_combo_values(self, combo, var, options, previous, default):
+        """Sets a dropdown's values only if they changed and restores the previous selection when still valid.
+        
+        Returns:
+            bool: True if the values were changed, False if they were already up to date.
+        """
+        # Compare with the values last set from Python rather than reading them back from Tk
+        options = tuple(options)
+        changed = self._combo_values.get(combo) != options
+        if changed:
+            combo.config(values=options)
+            self._combo_values[combo] = options
+        value = previous if previous in options else default
+        if var.get() != value:
+            var.set(value)
+        return changed
 
     def clear_console(self):
         """Clears the output console."""
-        self.output_console.config(state="normal")
         self.output_console.delete(1.0, tk.END)
-        self.output_console.config(state="disabled")
     
     def clear_ticket_selection(self):
         """Clears the ticket selection interface."""
-        if self.ticket_selection_frame:
-            self.ticket_selection_frame.destroy()
-            self.ticket_selection_frame = None
-        self.ticket_selection_vars = []
+        # The widgets are kept and reused; only the rows are removed
+        if self._row_fill_id is not None:
+            self.root.after_cancel(self._row_fill_id)
+            self._row_fill_id = None
+        self._rows_inserted = 0
+        if self.ticket_tree:
+            self.ticket_tree.delete(*self.ticket_tree.get_children())
+        self._ticket_count = 0
+        self._selection_bits = 0
         # Hide the container when no tickets are selected
         if hasattr(self, 'ticket_selection_container'):
             self.ticket_selection_container.pack_forget()
     
-    def create_ticket_selection_interface(self):
-        """Creates the ticket selection interface with checkboxes."""
-        # Clear any existing selection interface
-        self.clear_ticket_selection()
-        
-        if not self.parsed_issues:
-            return
-        
-        # Show the container BEFORE the console
-        self.ticket_selection_container.pack(fill="x", padx=10, pady=5, before=self.output_console)
-        
+    def build_ticket_selection_frame(self):
+        """Builds the ticket selection widgets once; later previews only refill the rows."""
         # Create a frame for ticket selection inside the container
         self.ticket_selection_frame = tk.Frame(self.ticket_selection_container, bg="#f0f0f0", relief="ridge", bd=2)
         self.ticket_selection_frame.pack(fill="both", expand=True)
@@ -450,75 +902,32 @@ class JiraApp:
                               font=("Arial", 12, "bold"), bg="#f0f0f0")
         title_label.pack(anchor="w", padx=10, pady=(10, 5))
         
-        # Create scrollable frame for ticket list
-        canvas = tk.Canvas(self.ticket_selection_frame, height=200, bg="#f0f0f0")
-        scrollbar = ttk.Scrollbar(self.ticket_selection_frame, orient="vertical", command=canvas.yview)
-        scrollable_frame = tk.Frame(canvas, bg="#f0f0f0")
+        # Ticket list - a Treeview only renders the visible rows, so large previews stay fast
+        list_frame = tk.Frame(self.ticket_selection_frame, bg="#f0f0f0")
+        list_frame.pack(fill="both", expand=True, padx=10, pady=(0, 10))
         
-        scrollable_frame.bind(
-            "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-        )
+        self.ticket_tree = ttk.Treeview(list_frame, columns=("sel", "title", "desc", "info"),
+                                        show="headings", height=8, selectmode="browse")
+        self.ticket_tree.heading("sel", text="✓")
+        self.ticket_tree.heading("title", text="📝 Summary")
+        self.ticket_tree.heading("desc", text="📄 Description")
+        self.ticket_tree.heading("info", text="Details")
+        self.ticket_tree.column("sel", width=30, minwidth=30, stretch=False, anchor="center")
+        self.ticket_tree.column("title", width=250, minwidth=120)
+        self.ticket_tree.column("desc", width=300, minwidth=120)
+        self.ticket_tree.column("info", width=160, minwidth=80)
         
-        canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
-        canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(list_frame, orient="vertical", command=self.ticket_tree.yview)
+        self.ticket_tree.configure(yscrollcommand=scrollbar.set)
         
-        # Create checkboxes for each ticket
-        self.ticket_selection_vars = []
-        for i, issue in enumerate(self.parsed_issues):
-            # Create checkbox variable (default to checked)
-            var = tk.BooleanVar(value=True)
-            self.ticket_selection_vars.append(var)
-            
-            # Create frame for this ticket
-            ticket_frame = tk.Frame(scrollable_frame, bg="#ffffff", relief="solid", bd=1)
-            ticket_frame.pack(fill="x", padx=5, pady=2)
-            
-            # Checkbox and ticket number
-            checkbox_frame = tk.Frame(ticket_frame, bg="#ffffff")
-            checkbox_frame.pack(fill="x", padx=5, pady=5)
-            
-            checkbox = tk.Checkbutton(checkbox_frame, variable=var, bg="#ffffff", 
-                                    command=self.update_create_button_text)
-            checkbox.pack(side="left")
-            
-            ticket_number_label = tk.Label(checkbox_frame, text=f"#{i+1}", 
-                                         font=("Arial", 10, "bold"), bg="#ffffff", fg="#666")
-            ticket_number_label.pack(side="left", padx=(5, 10))
-            
-            # Title
-            title_text = issue['title'][:80] + ('...' if len(issue['title']) > 80 else '')
-            title_label = tk.Label(ticket_frame, text=f"📝 {title_text}", 
-                                 font=("Arial", 10, "bold"), bg="#ffffff", anchor="w")
-            title_label.pack(fill="x", padx=5, pady=(0, 2))
-            
-            # Short description
-            desc_text = issue['description'][:150] + ('...' if len(issue['description']) > 150 else '')
-            desc_label = tk.Label(ticket_frame, text=f"📄 {desc_text}", 
-                                font=("Arial", 9), bg="#ffffff", anchor="w", 
-                                wraplength=700, justify="left", fg="#444")
-            desc_label.pack(fill="x", padx=5, pady=(0, 2))
-            
-            # Additional info (images, priority, etc.)
-            info_parts = []
-            if 'images' in issue and issue['images']:
-                info_parts.append(f"📸 {len(issue['images'])} images")
-            if 'priority' in issue:
-                info_parts.append(f"⚡ {issue['priority']}")
-            if 'complexity' in issue:
-                info_parts.append(f"🔧 {issue['complexity']}")
-            if 'category' in issue:
-                info_parts.append(f"📂 {issue['category']}")
-            
-            if info_parts:
-                info_text = " | ".join(info_parts)
-                info_label = tk.Label(ticket_frame, text=info_text, 
-                                    font=("Arial", 8), bg="#ffffff", anchor="w", fg="#666")
-                info_label.pack(fill="x", padx=5, pady=(0, 5))
+        # Toggle a ticket by clicking its checkbox cell or pressing space on the focused row.
+        # Bound once here, so repeated previews don't pile up callbacks.
+        self.ticket_tree.bind("<Button-1>", self.on_ticket_tree_click)
+        self.ticket_tree.bind("<space>", lambda e: self.toggle_ticket(self.ticket_tree.focus()))
         
-        # Pack canvas and scrollbar
-        canvas.pack(side="left", fill="both", expand=True, padx=(10, 0), pady=(0, 10))
-        scrollbar.pack(side="right", fill="y", pady=(0, 10))
+        # Pack tree and scrollbar
+        self.ticket_tree.pack(side="left", fill="both", expand=True)
+        scrollbar.pack(side="right", fill="y")
         
         # Control buttons
         button_frame = tk.Frame(self.ticket_selection_frame, bg="#f0f0f0")
@@ -532,29 +941,111 @@ class JiraApp:
         deselect_all_btn = tk.Button(button_frame, text="❌ Deselect All", 
                                    command=self.deselect_all_tickets, bg="#ffebee")
         deselect_all_btn.pack(side="left", padx=(0, 5))
+    
+    def create_ticket_selection_interface(self):
+        """Fills the ticket selection interface with a checkbox row per parsed issue."""
+        # Clear any existing selection interface
+        self.clear_ticket_selection()
+        
+        if not self.parsed_issues:
+            return
+        
+        if self.ticket_selection_frame is None:
+            self.build_ticket_selection_frame()
+        
+        # Show the container BEFORE the console
+        self.ticket_selection_container.pack(fill="x", padx=10, pady=5, before=self.output_console)
+        
+        # Every ticket starts checked
+        self._ticket_count = len(self.parsed_issues)
+        self._selection_bits = (1 << self._ticket_count) - 1
+        
+        # Show the first chunk of rows now and add the rest between event-loop passes
+        self.insert_ticket_rows()
+        
+        # Start at the top of the list
+        self.ticket_tree.yview_moveto(0)
         
         # Update the create button text
         self.update_create_button_text()
     
+    def insert_ticket_rows(self):
+        """Inserts the next chunk of ticket rows, scheduling itself until every issue has a row."""
+        self._row_fill_id = None
+        end = min(self._rows_inserted + TICKET_ROW_CHUNK, self._ticket_count)
+        for i in range(self._rows_inserted, end):
+            issue = self.parsed_issues[i]
+            
+            # Title and short description (Treeview cells are single-line)
+            title_text = shorten_preview(issue['title'], 80)
+            desc_text = shorten_preview(issue['description'], 150)
+            
+            # Additional info (images, priority, etc.)
+            info_parts = []
+            if 'images' in issue and issue['images']:
+                info_parts.append(f"📸 {len(issue['images'])} images")
+            if 'priority' in issue:
+                info_parts.append(f"⚡ {issue['priority']}")
+            if 'complexity' in issue:
+                info_parts.append(f"🔧 {issue['complexity']}")
+            if 'category' in issue:
+                info_parts.append(f"📂 {issue['category']}")
+            info_text = " | ".join(info_parts)
+            
+            # The selection may have changed (e.g. Deselect All) before this row was inserted
+            glyph = CHECKED_GLYPH if (self._selection_bits >> i) & 1 else UNCHECKED_GLYPH
+            self.ticket_tree.insert("", "end", iid=str(i),
+                                    values=(glyph, f"#{i+1} {title_text}", desc_text, info_text))
+        self._rows_inserted = end
+        
+        if end < self._ticket_count:
+            self._row_fill_id = self.root.after(1, self.insert_ticket_rows)
+    
+    def on_ticket_tree_click(self, event):
+        """Toggles a ticket when its checkbox cell is clicked."""
+        if self.ticket_tree.identify_region(event.x, event.y) != "cell":
+            return
+        if self.ticket_tree.identify_column(event.x) != "#1":
+            return
+        self.toggle_ticket(self.ticket_tree.identify_row(event.y))
+        return "break"
+    
+    def toggle_ticket(self, iid):
+        """Flips the selection state of the ticket row with the given id."""
+        if not iid:
+            return
+        index = int(iid)
+        self.set_ticket_selected(index, not (self._selection_bits >> index) & 1)
+        self.update_create_button_text()
+    
+    def set_ticket_selected(self, index, selected):
+        """Sets a ticket's selection state and updates its checkbox glyph."""
+        if selected:
+            self._selection_bits |= 1 << index
+        else:
+            self._selection_bits &= ~(1 << index)
+        # Rows not inserted yet pick their glyph up from the bitset when they are
+        if index < self._rows_inserted:
+            self.ticket_tree.set(str(index), "sel", CHECKED_GLYPH if selected else UNCHECKED_GLYPH)
+    
     def select_all_tickets(self):
         """Selects all tickets."""
-        for var in self.ticket_selection_vars:
-            var.set(True)
+        for i in range(self._ticket_count):
+            self.set_ticket_selected(i, True)
         self.update_create_button_text()
     
     def deselect_all_tickets(self):
         """Deselects all tickets."""
-        for var in self.ticket_selection_vars:
-            var.set(False)
+        for i in range(self._ticket_count):
+            self.set_ticket_selected(i, False)
         self.update_create_button_text()
     
     def update_create_button_text(self):
         """Updates the create button text based on selected tickets."""
-        if not self.ticket_selection_vars:
+        if not self._ticket_count:
             return
         
-        selected_count = sum(1 for var in self.ticket_selection_vars if var.get())
-        total_count = len(self.ticket_selection_vars)
+        selected_count = self._selection_bits.bit_count()
         
         if selected_count == 0:
             self.create_button.config(text="2️⃣ No Tickets Selected", 
@@ -563,162 +1054,276 @@ class JiraApp:
             self.create_button.config(text=f"2️⃣ Create {selected_count} Selected Tickets", 
                                     state="normal", bg="#4CAF50", fg="white")
     
+    def get_selected_count(self):
+        """Returns how many tickets are selected (all of them when there is no selection list)."""
+        if not self._ticket_count:
+            return len(self.parsed_issues)
+        return self._selection_bits.bit_count()
+
     def get_selected_issues(self):
-        """Returns only the selected issues based on checkbox states."""
-        if not self.ticket_selection_vars:
+        """Returns an iterable over only the selected issues, based on the checkbox states when called.
+        
+        The selection is consumed lazily, so no filtered copy of the issues is built.
+        """
+        if not self._ticket_count:
             return self.parsed_issues
         
-        selected_issues = []
-        for i, var in enumerate(self.ticket_selection_vars):
-            if var.get() and i < len(self.parsed_issues):
-                selected_issues.append(self.parsed_issues[i])
+        # Common case: everything is still checked
+        if self._selection_bits == (1 << self._ticket_count) - 1:
+            return self.parsed_issues
         
-        return selected_issues
+        bits = self._selection_bits
+        return (issue for i, issue in enumerate(self.parsed_issues) if (bits >> i) & 1)
 
     def log_message(self, message):
         """Logs a message to the output console in a thread-safe way."""
-        self.output_console.config(state="normal")
-        self.output_console.insert(tk.END, message + "\\n")
-        self.output_console.config(state="disabled")
-        self.output_console.see(tk.END) # Auto-scroll to the bottom
+        self.output_console.insert(tk.END, message + "\n")
+        self.schedule_scroll()
 
-    def flush(self):
-        """A required method for the fake stdout interface."""
-        pass
+    def log_many(self, lines):
+        """Logs several lines to the output console with a single insert."""
+        if not lines:
+            return
+        self.output_console.insert(tk.END, "\n".join(lines) + "\n")
+        self.schedule_scroll()
+
+    def schedule_scroll(self):
+        """Scrolls the console to the bottom soon, at most once per SCROLL_INTERVAL_MS however much is logged."""
+        if not self._scroll_pending:
+            self._scroll_pending = True
+            self.root.after(SCROLL_INTERVAL_MS, self._flush_scroll)
+
+    def _flush_scroll(self):
+        """Trims the console to CONSOLE_MAX_LINES and auto-scrolls it to the bottom."""
+        self._scroll_pending = False
+        line_count = int(self.output_console.index("end-1c").split(".")[0])
+        if line_count > CONSOLE_MAX_LINES:
+            self.output_console.delete("1.0", f"end - {CONSOLE_MAX_LINES} lines linestart")
+        self.output_console.see(tk.END)
+
+    def _block_console_edit(self, event):
+        """Lets navigation and copy keys through to the console and swallows everything that would edit it."""
+        if event.keysym in CONSOLE_NAV_KEYS or (event.state & CONSOLE_COPY_MODIFIERS and event.keysym.lower() in ("c", "a")):
+            return None
+        return "break"
 
     def preview_tickets(self):
-        """Parses the document and shows a preview of what tickets will be created."""
+        """Parses the document in the background and shows a preview of what tickets will be created."""
         if not self.selected_file:
             messagebox.showerror("Error", "Please select a Word document first.")
             return
 
+        self.clear_console()
+        self.clear_ticket_selection()
+        self.log_message("📄 Parsing document...")
+        
+        # Get selected analysis mode
+        analysis_mode = self.analysis_mode_var.get()
+        self.log_message(f"🔍 Analysis Mode: {analysis_mode}")
+        
+        # Check the chosen parsing method is usable before starting
+        if analysis_mode == "AI-Powered":
+            if not AI_AVAILABLE or not is_ai_available():
+                self.log_message("❌ AI analysis not available. Please configure OpenAI API key in config.py")
+                messagebox.showerror("AI Not Available", "AI analysis requires OpenAI API key configuration.\n\nPlease update config.py with your OpenAI API key.")
+                return
+            self.log_message("🤖 Using AI-powered analysis...")
+        elif analysis_mode == "Enhanced":
+            self.log_message("🔧 Using enhanced extraction (with images)...")
+        elif analysis_mode == "Comprehensive":
+            if not COMPREHENSIVE_AVAILABLE:
+                self.log_message("❌ Comprehensive document analyzer not available. Please install it.")
+                messagebox.showerror("Comprehensive Analyzer Not Available", "The Comprehensive Document Analyzer is not available. Please install it.")
+                return
+            self.log_message("🔍 Using comprehensive document analysis...")
+        else:  # Basic mode
+            self.log_message("📝 Using basic text extraction...")
+
         # Update button state during processing
         self.preview_button.config(state="disabled", text="🔄 Processing...")
-        self.status_label.config(text="🔄 Parsing document and generating preview...", fg="orange")
-        self.root.update()
+        self.browse_button.config(state="disabled")
+        self.create_button.config(state="disabled", bg="#cccccc", fg="gray", text="2️⃣ Create in Jira")
+        self.cancel_button.config(state="normal")
+        self._queue_status("🔄 Parsing document and generating preview...", "orange")
 
-        try:
-            self.clear_console()
-            self.clear_ticket_selection()
-            self.log_message("📄 Parsing document...")
-            
-            # Get selected analysis mode
-            analysis_mode = self.analysis_mode_var.get()
-            self.log_message(f"🔍 Analysis Mode: {analysis_mode}")
+        # Parse on the worker pool so the GUI stays responsive; issues stream back through the
+        # preview queue as they are found and are shown a batch per tick
+        self.parsed_issues = []
+        self._preview_q = queue.Queue()
+        self._cancel_preview.clear()
+        self._preview_future = self._pool.submit(self.parse_document, analysis_mode, self.selected_file, self._preview_q.put)
+        self.root.after(PREVIEW_DRAIN_INTERVAL_MS, self._drain_preview_queue, analysis_mode)
+
+    def parse_document(self, analysis_mode, filename, emit):
+        """Parses the document with the chosen analysis mode, reusing earlier results. Runs on a worker thread.
+        
+        Each issue is passed to emit as soon as it is found; the full list is returned at the end.
+        """
+        # One stat() fingerprints the file: saving it changes the mtime, so an edited file is always re-parsed.
+        # A missing file raises FileNotFoundError here, before any parsing work.
+        st = os.stat(filename)
+        key = (analysis_mode, filename, st.st_mtime_ns, st.st_size)
+        
+        with self._parse_cache_lock:
+            issues = self._parse_cache.get(key)
+            if issues is not None:
+                self._parse_cache.move_to_end(key)
+        if issues is not None:
+            for issue in issues:
+                emit(issue)
+            return issues
+        
+        issues = []
+        for issue in self.iter_parser(analysis_mode, filename):
+            if self._cancel_preview.is_set():
+                return issues  # A partial parse is not cached
             
-            # Choose parsing method based on analysis mode
-            if analysis_mode == "AI-Powered":
-                if not AI_AVAILABLE or not is_ai_available():
-                    self.log_message("❌ AI analysis not available. Please configure OpenAI API key in config.py")
-                    messagebox.showerror("AI Not Available", "AI analysis requires OpenAI API key configuration.\n\nPlease update config.py with your OpenAI API key.")
-                    return
-                
-                self.log_message("🤖 Using AI-powered analysis...")
-                self.parsed_issues = get_ai_enhanced_issues(self.selected_file)
-                
-            elif analysis_mode == "Enhanced":
-                self.log_message("🔧 Using enhanced extraction (with images)...")
-                self.parsed_issues = get_enhanced_issues(self.selected_file)
-                
-            elif analysis_mode == "Comprehensive":
-                if not COMPREHENSIVE_AVAILABLE:
-                    self.log_message("❌ Comprehensive document analyzer not available. Please install it.")
-                    messagebox.showerror("Comprehensive Analyzer Not Available", "The Comprehensive Document Analyzer is not available. Please install it.")
-                    return
-                self.log_message("🔍 Using comprehensive document analysis...")
-                self.parsed_issues = get_comprehensive_issues(self.selected_file)
-                
-            else:  # Basic mode
-                self.log_message("📝 Using basic text extraction...")
-                text = get_text(self.selected_file)
-                self.parsed_issues = parse_issues(text)
+            # Store derived preview text with the issues so cached re-previews don't recompute it
+            issue['_desc_preview'] = shorten_preview(issue['description'], DESC_PREVIEW_LENGTH, placeholder="…")
+            issues.append(issue)
+            emit(issue)
+        
+        with self._parse_cache_lock:
+            self._parse_cache[key] = issues
+            # Evict the least recently used documents
+            while len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+        return issues
+    
+    @staticmethod
+    def iter_parser(analysis_mode, filename):
+        """Runs the extractor for the chosen analysis mode on the document.
+        
+        Returns an iterator of issues; Basic and Enhanced modes yield them while parsing.
+        """
+        if analysis_mode == "AI-Powered":
+            from ai_document_analyzer import get_ai_enhanced_issues
+            return iter(get_ai_enhanced_issues(filename))
+        elif analysis_mode == "Enhanced":
+            from create_jira_tickets import iter_enhanced_issues
+            return iter_enhanced_issues(filename)
+        elif analysis_mode == "Comprehensive":
+            from comprehensive_document_analyzer import get_comprehensive_issues
+            return iter(get_comprehensive_issues(filename))
+        else:  # Basic mode
+            from create_jira_tickets import get_text, iter_issues
+            text = get_text(filename)
+            return iter_issues(text)
+
+    @staticmethod
+    def preview_lines(number, issue, is_ai_mode):
+        """Returns the console preview lines of one ticket."""
+        lines = [f"--- TICKET {number} ---", f"📝 Summary: {issue['title']}"]
+        
+        # Show description preview (first 200 chars, worked out once at parse time)
+        lines.append(f"📄 Description: {issue['_desc_preview']}")
+        
+        # Show AI analysis metadata if available
+        if is_ai_mode:
+            if 'priority' in issue:
+                lines.append(f"⚡ Priority: {issue['priority']}")
+            if 'complexity' in issue:
+                lines.append(f"🔧 Complexity: {issue['complexity']}")
+            if 'category' in issue:
+                lines.append(f"📂 Category: {issue['category']}")
+        
+        # Show image information if available (Enhanced and AI modes)
+        images = issue.get('images') or ()
+        if images:
+            lines.append(f"📸 Images: {len(images)} attached")
+            for img in images:
+                lines.append(f"   • {img['filename']} ({img['size']} bytes)")
+        
+        lines.append("")
+        return lines
+
+    def _drain_preview_queue(self, analysis_mode):
+        """Shows the tickets streamed from the parser so far, then re-arms itself until parsing is done."""
+        if self._closing:
+            return
+        
+        # Check for the end first: once the parse is done, everything it emitted is already queued
+        done = self._preview_future.done()
+        
+        # Every ticket that arrived since the last tick goes to the console in one write
+        is_ai_mode = analysis_mode == "AI-Powered"
+        lines = []
+        try:
+            while True:
+                issue = self._preview_q.get_nowait()
+                self.parsed_issues.append(issue)
+                lines.extend(self.preview_lines(len(self.parsed_issues), issue, is_ai_mode))
+        except queue.Empty:
+            pass
+        self.log_many(lines)
+        
+        if done:
+            self._on_preview_done()
+        else:
+            self.root.after(PREVIEW_DRAIN_INTERVAL_MS, self._drain_preview_queue, analysis_mode)
+
+    def _on_preview_done(self):
+        """Finishes the preview once the background parse has ended (or was stopped)."""
+        try:
+            self._preview_future.result()  # Raises the parser's error, if any
             
             if not self.parsed_issues:
                 self.log_message("❌ No issues found in the document. Please check the file content and formatting.")
                 self.create_button.config(state="disabled", bg="#cccccc", fg="gray", text="2️⃣ Create in Jira")
-                self.status_label.config(text="❌ No issues found. Check document format.", fg="red")
+                self._queue_status("❌ No issues found. Check document format.", "red")
                 return
 
-            self.log_message(f"✅ Found {len(self.parsed_issues)} issues to create:\\n")
-            
-            # Display preview of each ticket
-            for i, issue in enumerate(self.parsed_issues, 1):
-                self.log_message(f"--- TICKET {i} ---")
-                self.log_message(f"📝 Summary: {issue['title']}")
-                
-                # Show description preview (first 200 chars)
-                desc_preview = issue['description'][:200] + ('...' if len(issue['description']) > 200 else '')
-                self.log_message(f"📄 Description: {desc_preview}")
-                
-                # Show AI analysis metadata if available
-                if analysis_mode == "AI-Powered":
-                    if 'priority' in issue:
-                        self.log_message(f"⚡ Priority: {issue['priority']}")
-                    if 'complexity' in issue:
-                        self.log_message(f"🔧 Complexity: {issue['complexity']}")
-                    if 'category' in issue:
-                        self.log_message(f"📂 Category: {issue['category']}")
-                
-                # Show image information if available (Enhanced mode)
-                if 'images' in issue and issue['images']:
-                    self.log_message(f"📸 Images: {len(issue['images'])} attached")
-                    for img in issue['images']:
-                        self.log_message(f"   • {img['filename']} ({img['size']} bytes)")
-                
-                # Show image information for AI mode too
-                elif analysis_mode == "AI-Powered" and 'images' in issue and issue['images']:
-                    self.log_message(f"📸 Images: {len(issue['images'])} will be attached")
-                    for img in issue['images']:
-                        self.log_message(f"   • {img['filename']} ({img['size']} bytes)")
-                
-                self.log_message("")
-            
-            self.log_message("=" * 60)
-            self.log_message("✅ Preview complete! Review the tickets above.")
-            self.log_message("🎯 Select which tickets to create using the checkboxes below.")
+            lines = ["=" * 60]
+            if self._cancel_preview.is_set():
+                lines.append("⛔ Preview stopped before the end of the document.")
+            lines.append(f"✅ Found {len(self.parsed_issues)} issues to create.")
+            lines.append("✅ Preview complete! Review the tickets above.")
+            lines.append("🎯 Select which tickets to create using the checkboxes below.")
+            self.log_many(lines)
             
             # Create the ticket selection interface
             self.create_ticket_selection_interface()
             
             # Update status
-            self.status_label.config(text=f"✅ Found {len(self.parsed_issues)} tickets! Select which ones to create and fill in Jira credentials.", fg="green")
+            self._queue_status(f"✅ Found {len(self.parsed_issues)} tickets! Select which ones to create and fill in Jira credentials.", "green")
             
         except FileNotFoundError:
+            self.parsed_issues = []
             self.log_message(f"❌ Error: The file '{self.selected_file}' was not found.")
             self.create_button.config(state="disabled", bg="#cccccc", fg="gray", text="2️⃣ Create in Jira")
-            self.status_label.config(text="❌ File not found error", fg="red")
+            self._queue_status("❌ File not found error", "red")
         except Exception as e:
+            self.parsed_issues = []
             self.log_message(f"❌ An error occurred while parsing: {e}")
             self.create_button.config(state="disabled", bg="#cccccc", fg="gray", text="2️⃣ Create in Jira")
-            self.status_label.config(text="❌ Error during parsing", fg="red")
+            self._queue_status("❌ Error during parsing", "red")
+            messagebox.showerror("Parsing Error", f"An error occurred while parsing the document:\n\n{e}")
         finally:
-            # Reset preview button
+            # Reset preview, browse and cancel buttons
             self.preview_button.config(state="normal", text="1️⃣ Preview Tickets")
+            self.browse_button.config(state="normal")
+            self.cancel_button.config(state="disabled")
 
     def start_ticket_creation(self):
         """Validates inputs and starts the ticket creation process in a new thread."""
-        # Get form data
-        server = self.entries["Jira Server URL:"].get().strip()
-        username = self.entries["Jira Username:"].get().strip()
-        api_token = self.entries["API Token:"].get().strip()
-        project_key = self.project_var.get()
-        issue_type = self.issue_type_var.get()
-        
-        # Get selected epic
+        # Get form data in one pass; the worker only ever sees this snapshot
         selected_epic = self.epic_var.get()
-        epic_key = None
-        if selected_epic != "None" and ":" in selected_epic:
-            epic_key = selected_epic.split(":")[0].strip()
-        
-        # Get selected status
-        selected_status = self.status_var.get()
+        form = JiraForm(
+            server=self.entries["Jira Server URL:"].get().strip(),
+            username=self.entries["Jira Username:"].get().strip(),
+            api_token=self.entries["API Token:"].get().strip(),
+            project_key=self.project_var.get(),
+            issue_type=self.issue_type_var.get(),
+            epic_key=selected_epic.split(":")[0].strip() if selected_epic != "None" and ":" in selected_epic else None,
+            status=self.status_var.get() or None,
+        )
         
-        if not all([server, username, api_token, project_key]):
+        if not all([form.server, form.username, form.api_token, form.project_key]):
             messagebox.showerror("Missing Information", "Please fill in all required fields.")
             return
         
         # Validate project selection
-        if project_key == "Select Project..." or not project_key:
+        if form.project_key in ("Select Project...", COMBO_LOADING_TEXT) or not form.project_key:
             messagebox.showerror("Project Not Selected", "Please select a project from the dropdown. Click '🔄 Fetch Projects' if the list is empty.")
             return
 
@@ -727,170 +1332,195 @@ class JiraApp:
             return
 
         # Get selected tickets
-        selected_issues = self.get_selected_issues()
-        if not selected_issues:
+        selected_count = self.get_selected_count()
+        if not selected_count:
             messagebox.showerror("No Tickets Selected", "Please select at least one ticket to create.")
             return
+        selected_issues = self.get_selected_issues()
 
         # Confirmation dialog with clear details
-        epic_info = f"🔗 Epic: {epic_key}" if epic_key else "🔗 Epic: None"
-        status_info = f"🔗 Status: {selected_status}" if selected_status else "🔗 Status: None"
-        result = messagebox.askyesno(
-            "⚠️ Confirm Ticket Creation", 
-            f"You are about to create {len(selected_issues)} selected tickets in Jira:\\n\\n"
-            f"📍 Project: {project_key}\\n"
-            f"🎫 Selected Tickets: {len(selected_issues)} out of {len(self.parsed_issues)}\\n"
-            f"📋 Type: {issue_type}\\n"
-            f"{epic_info}\\n"
-            f"{status_info}\\n"
-            f"🔗 Server: {server}\\n\\n"
-            f"This action cannot be undone.\\n\\n"
-            f"Do you want to proceed?"
-        )
+        lines = [
+            f"You are about to create {selected_count} selected tickets in Jira:",
+            "",
+            f"📍 Project: {form.project_key}",
+            f"🎫 Selected Tickets: {selected_count} out of {len(self.parsed_issues)}",
+            f"📋 Type: {form.issue_type}",
+            f"🔗 Epic: {form.epic_key}" if form.epic_key else "🔗 Epic: None",
+            f"🔗 Status: {form.status}" if form.status else "🔗 Status: None",
+            f"🔗 Server: {form.server}",
+            "",
+            "This action cannot be undone.",
+            "",
+            "Do you want to proceed?",
+        ]
+        result = messagebox.askyesno("⚠️ Confirm Ticket Creation", "\n".join(lines))
         
         if not result:
-            self.status_label.config(text="❌ Ticket creation cancelled by user", fg="orange")
+            self._queue_status("❌ Ticket creation cancelled by user", "orange")
             return
 
         # Update status
-        self.status_label.config(text="🚀 Creating tickets in Jira... Please wait", fg="blue")
+        self._queue_status("🚀 Creating tickets in Jira... Please wait", "blue")
 
-        # Run the core logic in a separate thread to prevent the GUI from freezing
-        thread = threading.Thread(
-            target=self.run_creation_logic, 
-            args=(server, username, api_token, project_key, epic_key, selected_status, selected_issues)
-        )
-        thread.daemon = True # Allows main window to close even if thread is running
-        thread.start()
-
-    def run_creation_logic(self, server, username, api_token, project_key, epic_key=None, status_name=None, selected_issues=None):
-        """The core logic that creates Jira tickets from the selected issues."""
         # Disable buttons during processing to prevent multiple submissions
         self.create_button.config(state="disabled", text="🔄 Creating...", bg="#ff9800")
         self.preview_button.config(state="disabled")
-        
+        self.cancel_button.config(state="normal")
+
+        # Run on the creation worker (reused across clicks) so the GUI doesn't freeze
+        self._cancel_creation.clear()
+        future = self._creation_pool.submit(self.run_creation_logic, form, selected_issues, selected_count)
+        future.add_done_callback(lambda f: self._call_on_tk(self._on_creation_done))
+    
+    def cancel_running_job(self):
+        """Stops the running preview parse, or else the running ticket creation."""
+        if self._preview_future is not None and not self._preview_future.done():
+            self._cancel_preview.set()
+            self.cancel_button.config(state="disabled")
+            self.log_message("⛔ Stopping the preview - tickets found so far are kept...")
+        else:
+            self.cancel_ticket_creation()
+    
+    def cancel_ticket_creation(self):
+        """Asks the running creation job to stop after the tickets already in flight."""
+        self._cancel_creation.set()
+        self.cancel_button.config(state="disabled")
+        self.queue_log("⛔ Cancelling - tickets already being created will finish first...")
+
+    def run_creation_logic(self, form, selected_issues=None, selected_count=None):
+        """The core logic that creates Jira tickets from the selected issues, using the JiraForm snapshot."""
+        from jira import JIRAError
+        from create_jira_tickets import create_jira_tickets_with_type
+
+        # Runs on the creation worker: widgets are only touched from the Tk thread, so the console
+        # goes through the log queue and status updates and button resets are handed over with _call_on_tk
         try:
-            self.log_message("\n" + "=" * 60)
-            self.log_message("🚀 Starting Jira ticket creation...")
+            self.queue_log("\n" + "=" * 60)
+            self.queue_log("🚀 Starting Jira ticket creation...")
             
-            # Get the selected issue type
-            issue_type = self.issue_type_var.get()
-            self.log_message(f"📋 Issue Type: {issue_type}")
+            # Log the selected issue type
+            self.queue_log(f"📋 Issue Type: {form.issue_type}")
             
             # Log epic information
-            if epic_key:
-                self.log_message(f"🔗 Epic: {epic_key}")
+            if form.epic_key:
+                self.queue_log(f"🔗 Epic: {form.epic_key}")
             else:
-                self.log_message(f"🔗 Epic: None (tickets will not be linked to an epic)")
+                self.queue_log(f"🔗 Epic: None (tickets will not be linked to an epic)")
             
             # Log status information
-            if status_name:
-                self.log_message(f"🔗 Initial Status: {status_name}")
+            if form.status:
+                self.queue_log(f"🔗 Initial Status: {form.status}")
             else:
-                self.log_message(f"🔗 Initial Status: None (tickets will start as 'To Do')")
+                self.queue_log(f"🔗 Initial Status: None (tickets will start as 'To Do')")
+            
+            # Use selected issues (streamed to the creator in batches) or fall back to all parsed issues
+            if selected_issues is None:
+                selected_issues, selected_count = self.parsed_issues, len(self.parsed_issues)
             
-            # Use selected issues or fall back to all parsed issues
-            issues_to_create = selected_issues if selected_issues else self.parsed_issues
+            # Reuse the cached connection; if it can't be made, let the creator connect and explain why
+            try:
+                jira = self._get_jira(form.server, form.username, form.api_token)
+            except Exception:
+                jira = None
             
             # Temporarily redirect stdout to our GUI console to capture prints
-            sys.stdout = self
+            sys.stdout = QueueWriter(self._log_queue)
             
             # Call the main ticket creation function with our selected issues
-            created_tickets = create_jira_tickets_with_type(server, username, api_token, project_key, issues_to_create, issue_type, epic_key, status_name)
+            created_tickets = create_jira_tickets_with_type(form.server, form.username, form.api_token, form.project_key, selected_issues,
+                                                            form.issue_type, form.epic_key, form.status,
+                                                            max_workers=self.MAX_UPLOAD_WORKERS, total=selected_count,
+                                                            cancel_event=self._cancel_creation,
+                                                            jira=jira)
             
             if created_tickets:
-                self.log_message("\n🎉 All tickets created successfully!")
-                
-                # Create a detailed status message with ticket count and project info
-                project_key = self.project_var.get()
-                server = self.entries["Jira Server URL:"].get().strip()
+                self.queue_log("\n🎉 All tickets created successfully!")
                 
                 # Show detailed success information
-                success_msg = f"🎉 SUCCESS! Created {len(created_tickets)} tickets in project '{project_key}'"
-                self.status_label.config(text=success_msg, fg="green")
+                success_msg = f"🎉 SUCCESS! Created {len(created_tickets)} tickets in project '{form.project_key}'"
+                self._call_on_tk(self._queue_status, success_msg, "green")
                 
                 # Log additional success details
-                self.log_message_colored(f"\n📊 SUMMARY:", "dark green")
-                self.log_message_colored(f"   • Tickets Created: {len(created_tickets)}", "green")
-                self.log_message_colored(f"   • Project: {project_key}", "green")
-                self.log_message_colored(f"   • Server: {server}", "blue")
-                self.log_message_colored(f"   • View Project: {server}/projects/{project_key}", "blue")
+                self.queue_log(f"\n📊 SUMMARY:", "dark green")
+                self.queue_log(f"   • Tickets Created: {len(created_tickets)}", "green")
+                self.queue_log(f"   • Project: {form.project_key}", "green")
+                self.queue_log(f"   • Server: {form.server}", "blue")
+                self.queue_log(f"   • View Project: {form.server}/projects/{form.project_key}", "blue")
                 
             else:
-                self.log_message("\n❌ No tickets were created.")
-                self.status_label.config(text="❌ No tickets were created", fg="red")
+                self.queue_log("\n❌ No tickets were created.")
+                self._call_on_tk(self._queue_status, "❌ No tickets were created", "red")
 
         except JIRAError as e:
             # Handle specific Jira errors
             if e.status_code == 401:
                 error_msg = "Authentication failed. Please check your Jira username and API token."
-                self.log_message(f"\n❌ Error: {error_msg}")
-                self.status_label.config(text="❌ Authentication failed - check credentials", fg="red")
+                self.queue_log(f"\n❌ Error: {error_msg}")
+                self._call_on_tk(self._queue_status, "❌ Authentication failed - check credentials", "red")
             elif e.status_code == 404:
-                error_msg = f"Could not find project with key '{project_key}'. Please verify the project key."
-                self.log_message(f"\n❌ Error: {error_msg}")
-                self.status_label.config(text=f"❌ Project '{project_key}' not found", fg="red")
+                error_msg = f"Could not find project with key '{form.project_key}'. Please verify the project key."
+                self.queue_log(f"\n❌ Error: {error_msg}")
+                self._call_on_tk(self._queue_status, f"❌ Project '{form.project_key}' not found", "red")
             else:
-                self.log_message(f"\n❌ An error occurred with Jira: {e.text}")
-                self.status_label.config(text="❌ Jira error occurred", fg="red")
+                self.queue_log(f"\n❌ An error occurred with Jira: {e.text}")
+                self._call_on_tk(self._queue_status, "❌ Jira error occurred", "red")
         except Exception as e:
             # Handle any other unexpected errors
-            self.log_message(f"\n❌ An unexpected error occurred: {e}")
-            self.status_label.config(text="❌ Unexpected error occurred", fg="red")
+            self.queue_log(f"\n❌ An unexpected error occurred: {e}")
+            self._call_on_tk(self._queue_status, "❌ Unexpected error occurred", "red")
         finally:
-            # Restore standard output and re-enable buttons
+            # Restore standard output; the buttons are re-enabled by _on_creation_done
             sys.stdout = sys.__stdout__
-            # Update button text based on current selection
-            self.update_create_button_text()
-            self.preview_button.config(state="normal")
     
-    # --- Stdout Redirection ---
+    def _on_creation_done(self):
+        """Re-enables the buttons once the creation job has finished. Runs on the Tk thread."""
+        # Update button text based on current selection
+        self.update_create_button_text()
+        self.preview_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
     
-    def write(self, message):
-        """A fake write method to redirect stdout from other modules to the GUI."""
-        # Avoid printing empty lines
-        if message.strip():
-            # Check if this is a success summary line and format it nicely
-            if message.strip().startswith("✅") and ":" in message:
-                # This is a ticket creation success line - format it with green color
-                self.log_message_colored(message.strip(), "green")
-            elif message.strip().startswith("🎉") or "Successfully created" in message:
-                # This is a major success message
-                self.log_message_colored(message.strip(), "dark green")
-            elif message.strip().startswith("📍") or message.strip().startswith("🌐"):
-                # This is project/URL information
-                self.log_message_colored(message.strip(), "blue")
-            else:
-                # Regular message
-                self.log_message(message.strip())
+    # --- Console Queue ---
+    
+    def queue_log(self, message, color=None):
+        """Queues a console message from any thread; color None means a plain log_message line."""
+        self._log_queue.put((message, color))
 
-    def log_message_colored(self, message, color="black"):
-        """Logs a colored message to the output console."""
-        self.output_console.config(state="normal")
+    def _drain_log_queue(self):
+        """Writes queued console messages on the Tk thread, then re-arms itself."""
+        if self._closing:
+            return
         
-        # Insert the message with color
-        start_pos = self.output_console.index(tk.END)
-        self.output_console.insert(tk.END, message + "\n")
-        end_pos = self.output_console.index(tk.END)
-        
-        # Apply color tag
-        color_tag = f"color_{color.replace(' ', '_')}"
-        self.output_console.tag_add(color_tag, start_pos, end_pos)
-        
-        # Configure the color tag
-        if color == "green":
-            self.output_console.tag_config(color_tag, foreground="#2E7D32")
-        elif color == "dark green":
-            self.output_console.tag_config(color_tag, foreground="#1B5E20", font=("Arial", 9, "bold"))
-        elif color == "blue":
-            self.output_console.tag_config(color_tag, foreground="#1565C0")
-        elif color == "red":
-            self.output_console.tag_config(color_tag, foreground="#C62828")
-        else:
-            self.output_console.tag_config(color_tag, foreground="black")
+        messages = []
+        try:
+            while len(messages) < LOG_DRAIN_BATCH:
+                messages.append(self._log_queue.get_nowait())
+        except queue.Empty:
+            pass
+        
+        self.log_many_colored(messages)
+        self.root.after(LOG_DRAIN_INTERVAL_MS, self._drain_log_queue)
+
+    def log_many_colored(self, messages):
+        """Logs (message, color) pairs to the output console with a single insert."""
+        if not messages:
+            return
+        
+        # Tk's insert takes alternating text and tag arguments; consecutive lines with the same
+        # color are joined into one run, and lines without a known color get no tag
+        args = []
+        run = []
+        run_tag = None
+        for message, color in messages:
+            tag = _COLOR_TAGS.get(color, ())
+            if run and tag != run_tag:
+                args += ("\n".join(run) + "\n", run_tag)
+                run = []
+            run_tag = tag
+            run.append(message)
+        args += ("\n".join(run) + "\n", run_tag)
         
-        self.output_console.config(state="disabled")
-        self.output_console.see(tk.END)  # Auto-scroll to the bottom
+        self.output_console.insert(tk.END, *args)
+        self.schedule_scroll()
 
 if __name__ == "__main__":
     root = tk.Tk()
@@ -2,7 +2,15 @@
 """
 List all Jira projects the user has access to
 """
-from jira import JIRA, JIRAError
+import json
+from jira import JIRAError
+from jira_client import get_jira
+
+def get_creatable_project_keys(jira):
+    """Returns the keys of every project the user may create issues in, with one request"""
+    response = jira._session.post(jira._get_url("permissions/project"),
+                                  data=json.dumps({"permissions": ["CREATE_ISSUES"]}))
+    return {project['key'] for project in response.json()['projects']}
 
 def list_accessible_projects(server, username, api_token):
     print(f"Connecting to: {server}")
@@ -10,28 +18,32 @@ def list_accessible_projects(server, username, api_token):
     print("-" * 50)
     
     try:
-        jira = JIRA(server=server, basic_auth=(username, api_token))
+        jira = get_jira(server, username, api_token)
         print("✅ Successfully connected to Jira")
         
-        # Get all projects the user can see
-        projects = jira.projects()
+        # Get all projects the user can see, with their issue types in the same response
+        projects = jira.projects(expand="issueTypes")
         
         if projects:
             print(f"\n📁 Found {len(projects)} accessible projects:")
             print("-" * 50)
             
+            # Test which projects we can create issues in
+            try:
+                creatable_keys = get_creatable_project_keys(jira)
+            except Exception:
+                creatable_keys = None
+            
             for project in projects:
                 print(f"🔹 {project.key} - {project.name}")
-                try:
-                    # Test if we can create issues in this project
-                    issue_types = jira.createmeta(projectKeys=project.key)
-                    if issue_types['projects']:
-                        available_types = [it['name'] for it in issue_types['projects'][0]['issuetypes']]
-                        print(f"   ✅ Can create: {', '.join(available_types)}")
-                    else:
-                        print(f"   ❌ Cannot create issues")
-                except:
+                available_types = [it['name'] for it in project.raw.get('issueTypes', [])]
+                if creatable_keys is None:
                     print(f"   ❓ Unknown permissions")
+                    print(f"   📋 Issue types: {', '.join(available_types)}")
+                elif project.key in creatable_keys:
+                    print(f"   ✅ Can create: {', '.join(available_types)}")
+                else:
+                    print(f"   ❌ Cannot create issues")
                 print()
         else:
             print("❌ No accessible projects found")
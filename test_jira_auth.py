@@ -3,7 +3,9 @@
 Simple script to test Jira authentication and project access
 """
 import sys
-from jira import JIRA, JIRAError
+from concurrent.futures import ThreadPoolExecutor
+from jira import JIRAError
+from jira_client import get_jira
 
 def test_jira_connection(server, username, api_token, project_key):
     print(f"Testing connection to: {server}")
@@ -13,19 +15,25 @@ def test_jira_connection(server, username, api_token, project_key):
     
     try:
         # Create JIRA connection
-        jira = JIRA(server=server, basic_auth=(username, api_token))
+        jira = get_jira(server, username, api_token)
         print("✅ Successfully connected to Jira")
         
+        # The three checks are independent, so send them at once and report them in order
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            server_info_future = executor.submit(jira.server_info)
+            project_future = executor.submit(jira.project, project_key)
+            createmeta_future = executor.submit(jira.createmeta, projectKeys=project_key)
+        
         # Test server info
         try:
-            server_info = jira.server_info()
+            server_info = server_info_future.result()
             print(f"✅ Server: {server_info.get('serverTitle', 'Unknown')}")
         except Exception as e:
             print(f"⚠️  Server info failed: {e}")
         
         # Test project access
         try:
-            project = jira.project(project_key)
+            project = project_future.result()
             print(f"✅ Project found: {project.name}")
             print(f"   Key: {project.key}")
             print(f"   Lead: {getattr(project, 'lead', 'Unknown')}")
@@ -46,7 +54,7 @@ def test_jira_connection(server, username, api_token, project_key):
         # Test issue creation permissions
         try:
             # Get issue types for the project
-            issue_types = jira.createmeta(projectKeys=project_key)
+            issue_types = createmeta_future.result()
             if issue_types['projects']:
                 project_meta = issue_types['projects'][0]
                 available_types = [it['name'] for it in project_meta['issuetypes']]